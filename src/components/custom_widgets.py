@@ -1,5 +1,5 @@
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QMovie
+from PyQt6.QtGui import QImageReader, QMovie
 from PyQt6.QtWidgets import QLabel
 
 
@@ -8,17 +8,31 @@ class ScaledLabel(QLabel):
         super().__init__(*args, **kwargs)
         self.setMinimumSize(1, 1)
         self._movie = None
+        self._movie_size = QSize()
 
     def setMovie(self, movie):
         if self._movie:
             self._movie.frameChanged.disconnect(self.on_frame_changed)
         self._movie = movie
+        self._movie_size = QSize()
         if self._movie:
+            # Native frame size from the file header, since the movie itself
+            # reports frames at its scaled size
+            self._movie_size = QImageReader(self._movie.fileName()).size()
+            self._update_scaled_size()
             self._movie.frameChanged.connect(self.on_frame_changed)
 
+    def _update_scaled_size(self):
+        """Have the movie decode frames at the size they are displayed at"""
+        if self._movie_size.isValid() and not self.size().isEmpty():
+            self._movie.setScaledSize(
+                self._movie_size.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio)
+            )
+
     def on_frame_changed(self, frame_number):
         if self.size().width() > 0 and self.size().height() > 0 and self._movie:
             pixmap = self._movie.currentPixmap()
+            # A no-op when the movie already decodes at the label's size
             scaled_pixmap = pixmap.scaled(
                 self.size(),
                 Qt.AspectRatioMode.KeepAspectRatio,
@@ -28,6 +42,7 @@ class ScaledLabel(QLabel):
 
     def resizeEvent(self, event):
         if self._movie:
+            self._update_scaled_size()
             self.on_frame_changed(0)
         super().resizeEvent(event)
 
@@ -1,21 +1,125 @@
+import heapq
+import itertools
+import json
 import logging
+import operator
 import os
 import re
+import selectors
 import shutil
+import signal
+import struct
 import subprocess
 import sys
-import tempfile
+import threading
 import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from PyQt6.QtCore import QMutex, QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QMutex, QObject, QRunnable, QThreadPool, pyqtSignal
 
-from utils.helpers import resource_path
+from utils.helpers import get_base_path, resource_path
 from utils.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Result of the Wine 32-bit capability test, keyed by wine binary path and mtime
+WINE_ARCH_CACHE_FILE = "wine_arch.json"
+
+HOME_DIR = os.path.expanduser("~")
+
+# Common Steam installation paths (comprehensive for all distros including SteamOS)
+PROTON_SEARCH_PATHS = (
+    # Native Steam
+    os.path.join(HOME_DIR, ".local/share/Steam/steamapps/common"),  # Official Protons
+    os.path.join(HOME_DIR, ".local/share/Steam/compatibilitytools.d"),  # Unofficial Protons
+    # Flatpak Steam
+    #os.path.join(HOME_DIR, ".var/app/com.valvesoftware.Steam/data/Steam/steamapps/common"),
+    #os.path.join(HOME_DIR, ".var/app/com.valvesoftware.Steam/data/Steam/compatibilitytools.d"),
+    # Snap Steam (rare/deprecated)
+    #os.path.join(HOME_DIR, "snap/steam/common/.local/share/Steam/steamapps/common"),
+    #os.path.join(HOME_DIR, "snap/steam/common/.local/share/Steam/compatibilitytools.d"),
+    # Distro Specific
+    "/usr/share/steam/compatibilitytools.d",  # CachyOS Protons
+)
+
+# Wine prefixes: a dedicated XDG-compliant one for Proton, the user's default for system Wine
+PROTON_STEAMLESS_PREFIX = os.path.join(HOME_DIR, ".local/share/ACCELA/steamless/bin/pfx")
+SYSTEM_WINE_PREFIX = os.path.join(HOME_DIR, ".wine")
+
+# Sort key for executable candidates (higher priority first)
+EXE_PRIORITY_KEY = operator.itemgetter("priority")
+
+# Threads used to walk a game directory's top-level subtrees in parallel
+EXE_SCAN_WORKERS = 4
+
+# Directories (lowercase names) that only hold redistributables/installers/crash
+# tooling; the executable scan does not descend into them
+PRUNE_EXE_DIRS = frozenset(
+    {
+        "_commonredist",
+        "commonredist",
+        "redist",
+        "directx",
+        "vcredist",
+        "dotnet",
+        "_installer",
+        "installers",
+        "crashhandler",
+        "crashreporter",
+    }
+)
+
+# Executables that are never the main game binary, matched case-insensitively
+SKIP_EXE_RE = re.compile(
+    r"""
+    (?:unins       # uninstallers
+      |setup       # installers
+      |config      # configuration tools
+      |launcher    # launchers (usually not the main game)
+      |updater     # updaters
+      |patch       # patches
+      |redist      # redistributables
+      |vcredist    # Visual C++ redistributables
+      |dxsetup     # DirectX setup
+      |physx       # PhysX installers
+    ).*\.exe$
+    |.*(?:crash    # crash handlers
+         |handler  # handlers
+         |unity    # Unity crash handlers and utilities
+    ).*\.exe$
+    |.*\.original\.exe$  # Steamless backup files
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# Priority penalties for likely non-game executables, applied cumulatively to
+# the lowercased filename
+EXE_PRIORITY_PENALTIES = (
+    (re.compile(r"editor|tool|config|settings"), 20),  # non-game executables
+    (re.compile(r"crash|handler|debug|unitycrash"), 50),  # crash handlers, utilities
+    (re.compile(r"unityplayer|unity crash|crash handler"), 100),  # Unity system files
+)
+
+# winetricks output lines worth forwarding to the UI, matched on the raw bytes
+WINETRICKS_PROGRESS_RE = re.compile(
+    rb"installing|done|error|success|completed|setting|download", re.IGNORECASE
+)
+
+# Steamless.CLI options used for every executable (after "-f <target>")
+STEAMLESS_ARGS = ("--quiet", "--realign", "--recalcchecksum")
+
+# Steamless output markers, matched on the raw output bytes
+STEAMLESS_DRM_RE = re.compile(rb"steam ?stub|drift|packed with", re.IGNORECASE)
+STEAMLESS_UNPACKED_RE = re.compile(
+    rb"unpacked file saved (?:to disk|as)|successfully unpacked file"
+    rb"|unpacked.*\.exe|\.exe.*unpacked",
+    re.IGNORECASE,
+)
+
 
 class SteamlessIntegration(QObject):
     """
@@ -38,9 +142,17 @@ class SteamlessIntegration(QObject):
         self.wine_command = None
         self._wine_check_message = None
         self._current_process = None
-        self._process_mutex = QMutex()
-        self._available_proton_versions = []
+        self._wakeup_w = None  # Write end of the output reader's wakeup pipe
+        self._process_lock = threading.Lock()
+        self._available_proton_versions = ()
         self._wine_arch = None  # Will store "win32" or "win64"
+        self._proton_env = None  # Proton-specific env overrides, built on first use
+        self._steamless_prefix_path = None  # Resolved (and created) on first use
+        self._winetricks_path = None  # Resolved on first use
+        self._prefix_ready = False  # Wine prefix initialized and .NET confirmed
+        self._steamless_cli_path = None  # Validated in process_game_with_steamless
+        self._steamless_env = None  # Built once per process_game_with_steamless call
+        self._steamless_env_overrides = None  # Resolved on first Steamless run
         try:
             self.wine_available = self._check_wine_availability()
         except Exception as e:
@@ -49,41 +161,37 @@ class SteamlessIntegration(QObject):
             )
             self.wine_available = False
             self.wine_command = None
+        # Proton vs system Wine never changes after detection
+        self._is_proton = bool(self.wine_command) and "proton" in self.wine_command.lower()
         self.dotnet_available = False
 
-    def _find_proton_installation(self) -> Optional[str]:
-        """Find Proton installation from Steam directories."""
-        # Common Steam installation paths (comprehensive for all distros including SteamOS)
-        steam_paths = [
-            # Native Steam
-            Path.home() / ".local/share/Steam/steamapps/common",  # Official Protons
-            Path.home() / ".local/share/Steam/compatibilitytools.d",  # Unofficial Protons
-            # Flatpak Steam
-            #Path.home() / ".var/app/com.valvesoftware.Steam/data/Steam/steamapps/common",
-            #Path.home() / ".var/app/com.valvesoftware.Steam/data/Steam/compatibilitytools.d",
-            # Snap Steam (rare/deprecated)
-            #Path.home() / "snap/steam/common/.local/share/Steam/steamapps/common",
-            #Path.home() / "snap/steam/common/.local/share/Steam/compatibilitytools.d",
-            # Distro Specific
-            Path("/usr/share/steam/compatibilitytools.d"),  # CachyOS Protons
-        ]
-
+    def _find_proton_installation(self, fast_first: bool = False) -> Optional[str]:
+        """
+        Find Proton installation from Steam directories.
+        With fast_first, return the first Proton Experimental found without
+        building the full sorted list; the full scan then runs lazily from
+        get_available_proton_versions().
+        """
         proton_installations = []
 
-        for steam_path in steam_paths:
+        for steam_path in PROTON_SEARCH_PATHS:
             try:
                 # Skip if path doesn't exist or we can't access it
-                if not steam_path.exists() or not os.access(steam_path, os.R_OK):
+                if not os.access(steam_path, os.R_OK):
                     continue
 
                 # Look for Proton directories (case-insensitive to match both "Proton*" and "proton*")
-                for proton_dir in list(steam_path.glob("Proton*")) + list(
-                    steam_path.glob("proton*")
-                ):
+                # DirEntry.is_dir() answers from the readdir d_type for plain directories,
+                # only symlinked Protons (common in compatibilitytools.d) need a stat
+                with os.scandir(steam_path) as entries:
+                    proton_dirs = [
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.name.lower().startswith("proton") and entry.is_dir()
+                    ]
+
+                for proton_dir in proton_dirs:
                     try:
-                        if not proton_dir.is_dir():
-                            continue
-
                         # Check for wine binary in common Proton locations
                         wine_paths = [
                             proton_dir / "files" / "bin" / "wine",
@@ -92,11 +200,17 @@ class SteamlessIntegration(QObject):
 
                         for wine_path in wine_paths:
                             try:
-                                if (
-                                    wine_path.exists()
-                                    and wine_path.is_file()
-                                    and os.access(wine_path, os.X_OK)
+                                if wine_path.is_file() and os.access(
+                                    wine_path, os.X_OK
                                 ):
+                                    if (
+                                        fast_first
+                                        and "experimental" in proton_dir.name.lower()
+                                    ):
+                                        logger.info(
+                                            f"Found installation: {proton_dir.name} at {wine_path}"
+                                        )
+                                        return str(wine_path)
                                     proton_installations.append(
                                         {
                                             "name": proton_dir.name,
@@ -162,18 +276,22 @@ class SteamlessIntegration(QObject):
             # 1. Proton Experimental (newest first)
             # 2. System Wine (if available)
             # 3. Regular Proton versions (newest first)
-            proton_installations = experimental_versions.copy()
-            if wine_installation:
-                proton_installations.append(
+            system_wine = (
+                [
                     {
                         "name": "System Wine",
                         "path": wine_installation,
                         "dir": os.path.dirname(wine_installation),
                     }
-                )
-            proton_installations.extend(regular_versions)
+                ]
+                if wine_installation
+                else ()
+            )
 
-            # Store all discovered versions
+            # Store all discovered versions (immutable once detection is complete)
+            proton_installations = tuple(
+                itertools.chain(experimental_versions, system_wine, regular_versions)
+            )
             self._available_proton_versions = proton_installations
 
             # Return the first available option (highest priority)
@@ -218,12 +336,8 @@ class SteamlessIntegration(QObject):
         if self.is_windows or not self.wine_command:
             return "win64"  # Default
 
-        # Determine if we're using Proton or System Wine
-        wine_path_lower = self.wine_command.lower()
-        is_proton = "proton" in wine_path_lower
-
         # For Proton, always use win32 (Proton supports it)
-        if is_proton:
+        if self._is_proton:
             logger.debug("Using Proton - will use win32 architecture")
             return "win32"
 
@@ -231,7 +345,7 @@ class SteamlessIntegration(QObject):
         logger.info("Checking Wine prefix architecture...")
 
         try:
-            prefix_path = str(Path.home() / ".wine")
+            prefix_path = SYSTEM_WINE_PREFIX
 
             # If no prefix exists yet, we can use win32
             if not os.path.exists(prefix_path):
@@ -243,21 +357,19 @@ class SteamlessIntegration(QObject):
                 logger.info("Wine prefix not fully initialized, will use win32")
                 return "win32"
 
-            # Read the system.reg to check architecture
+            # Read the system.reg header to check architecture
             try:
-                with open(
-                    os.path.join(prefix_path, "system.reg"),
-                    "r",
-                    encoding="utf-8",
-                    errors="ignore",
-                ) as f:
-                    first_lines = f.read(500)  # Read first 500 chars
-                    if "#arch=win64" in first_lines:
-                        logger.info("Existing Wine prefix is 64-bit, will use win64")
-                        return "win64"
-                    else:
-                        logger.info("Existing Wine prefix is 32-bit, will use win32")
-                        return "win32"
+                fd = os.open(os.path.join(prefix_path, "system.reg"), os.O_RDONLY)
+                try:
+                    header = os.read(fd, 512)  # "#arch=" is in the first few lines
+                finally:
+                    os.close(fd)
+                if b"#arch=win64" in header:
+                    logger.info("Existing Wine prefix is 64-bit, will use win64")
+                    return "win64"
+                else:
+                    logger.info("Existing Wine prefix is 32-bit, will use win32")
+                    return "win32"
             except Exception as e:
                 logger.warning(f"Could not read Wine prefix architecture: {e}")
                 # Fall back to test mode
@@ -266,32 +378,39 @@ class SteamlessIntegration(QObject):
             logger.warning(f"Error checking Wine prefix: {e}")
 
         # If we can't determine from existing prefix, test Wine's capability
+        cached_arch = self._load_cached_wine_arch()
+        if cached_arch:
+            logger.info(f"Using cached Wine architecture test result: {cached_arch}")
+            return cached_arch
+
         logger.info("Testing Wine 32-bit prefix capability...")
-        test_prefix = None
         try:
-            test_prefix = os.path.join(
-                tempfile.gettempdir(), f"wine_arch_test_{os.getpid()}"
-            )
-
-            # Try to initialize with win32
-            env = os.environ.copy()
-            env["WINEDEBUG"] = "-all"
-            env["WINEPREFIX"] = test_prefix
-            env["WINE"] = self.wine_command
-            env["WINEARCH"] = "win32"
+            import tempfile  # Only needed for this Linux-only probe
+
+            # The throwaway prefix (and everything Wine wrote to it) is removed
+            # when the context exits
+            with tempfile.TemporaryDirectory(
+                prefix="wine_arch_test_", ignore_cleanup_errors=True
+            ) as test_prefix:
+                # Try to initialize with win32
+                env = os.environ.copy()
+                env["WINEDEBUG"] = "-all"
+                env["WINEPREFIX"] = test_prefix
+                env["WINE"] = self.wine_command
+                env["WINEARCH"] = "win32"
 
-            logger.debug(f"Testing Wine with WINEARCH=win32 and prefix={test_prefix}")
+                logger.debug(
+                    f"Testing Wine with WINEARCH=win32 and prefix={test_prefix}"
+                )
 
-            # Try a simple command
-            result = subprocess.run(
-                [self.wine_command, "cmd", "/c", "echo test"],
-                capture_output=True,
-                timeout=5,
-                env=env,
-            )
+                # Try a simple command
+                process = self._spawn_wine_process(
+                    [self.wine_command, "cmd", "/c", "echo test"], env
+                )
+                _, _, stderr = self._collect_wine_process(process, timeout=5)
 
             # Check for the specific error
-            stderr_output = result.stderr.decode("utf-8", errors="ignore").lower()
+            stderr_output = stderr.lower()
             if (
                 "winear ch is set to 'win32' but this is not supported in wow64 mode"
                 in stderr_output
@@ -299,9 +418,11 @@ class SteamlessIntegration(QObject):
                 logger.warning(
                     "Wine does not support 32-bit prefixes, falling back to 64-bit"
                 )
+                self._store_cached_wine_arch("win64")
                 return "win64"
             else:
                 logger.info("Wine supports 32-bit prefixes")
+                self._store_cached_wine_arch("win32")
                 return "win32"
 
         except subprocess.TimeoutExpired:
@@ -310,14 +431,82 @@ class SteamlessIntegration(QObject):
         except Exception as e:
             logger.warning(f"Wine architecture test failed: {e}, assuming win64")
             return "win64"
+
+    def _wine_arch_cache_key(self) -> str:
+        """Key the architecture cache on the wine binary and its mtime."""
+        wine_path = os.path.realpath(self.wine_command)
+        return f"{wine_path}:{os.stat(wine_path).st_mtime_ns}"
+
+    def _load_cached_wine_arch(self) -> Optional[str]:
+        """Return the cached capability test result for the current wine binary."""
+        cache_file = get_base_path() / WINE_ARCH_CACHE_FILE
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            arch = cache.get(self._wine_arch_cache_key())
+        except (OSError, ValueError, AttributeError):
+            return None
+        return arch if arch in ("win32", "win64") else None
+
+    def _store_cached_wine_arch(self, arch: str):
+        """Record the capability test result so later instances skip the test."""
+        cache_file = get_base_path() / WINE_ARCH_CACHE_FILE
+        try:
+            key = self._wine_arch_cache_key()
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if not isinstance(cache, dict):
+                    cache = {}
+            except (OSError, ValueError):
+                cache = {}
+            # Drop entries for older builds of the same binary
+            wine_path = key.rsplit(":", 1)[0]
+            cache = {k: v for k, v in cache.items() if k.rsplit(":", 1)[0] != wine_path}
+            cache[key] = arch
+
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write Wine architecture cache: {e}")
+
+    def _spawn_wine_process(self, cmd: List[str], env: dict) -> subprocess.Popen:
+        """
+        Start a short-lived Wine helper command (registry query, prefix test).
+        The process is registered as the current process so terminate_process()
+        can cancel it instead of waiting out the timeout.
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="ignore",
+            env=env,
+        )
+        with self._process_lock:
+            self._current_process = process
+        return process
+
+    def _collect_wine_process(self, process: subprocess.Popen, timeout: float):
+        """
+        Wait for a process started by _spawn_wine_process.
+        Returns (returncode, stdout, stderr); raises TimeoutExpired after killing it.
+        """
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
         finally:
-            # Clean up test prefix
-            if test_prefix and os.path.exists(test_prefix):
-                try:
-                    shutil.rmtree(test_prefix)
-                    logger.debug(f"Cleaned up test prefix: {test_prefix}")
-                except Exception:
-                    pass  # Don't fail on cleanup
+            with self._process_lock:
+                if self._current_process is process:
+                    self._current_process = None
+        return process.returncode, stdout or "", stderr or ""
 
     def _get_wine_architecture(self) -> str:
         """
@@ -328,16 +517,40 @@ class SteamlessIntegration(QObject):
             self._wine_arch = self._detect_wine_architecture()
         return self._wine_arch
 
-    def get_available_proton_versions(self) -> List[dict]:
+    def _get_proton_env(self) -> dict:
+        """
+        Get the environment overrides Proton's bundled wine needs.
+        Built once from the Proton root and reused for every Wine invocation.
+        """
+        if self._proton_env is None:
+            wine_bin_dir = Path(self.wine_command).parent
+            proton_root = wine_bin_dir.parent.parent
+            proton_lib_dir = proton_root / "lib"
+            proton_lib64_dir = proton_root / "lib64"
+
+            # The lib64 probe happens here once; every caller reuses the result
+            ld_library_path = str(proton_lib_dir)
+            if proton_lib64_dir.is_dir():
+                ld_library_path = f"{proton_lib64_dir}:{ld_library_path}"
+
+            existing_ld_path = os.environ.get("LD_LIBRARY_PATH", "")
+            if existing_ld_path:
+                ld_library_path = f"{ld_library_path}:{existing_ld_path}"
+
+            self._proton_env = {"LD_LIBRARY_PATH": ld_library_path}
+        return self._proton_env
+
+    def get_available_proton_versions(self) -> Tuple[dict, ...]:
         """
-        Get list of all available Proton versions discovered by _find_proton_installation.
-        Returns a list of dictionaries with 'name', 'path', and 'dir' keys.
+        Get all available Proton versions discovered by _find_proton_installation.
+        Returns a tuple of dictionaries with 'name', 'path', and 'dir' keys in
+        priority order. The tuple is shared, so callers must not modify the dicts.
         """
         # If we haven't discovered versions yet, do it now
         if not self._available_proton_versions:
             self._find_proton_installation()
 
-        return self._available_proton_versions.copy()
+        return self._available_proton_versions
 
     def _check_wine_availability(self) -> bool:
         """Check if Proton or Wine is available for Steamless execution."""
@@ -348,9 +561,14 @@ class SteamlessIntegration(QObject):
                 self.wine_command = None  # Not needed on Windows
                 return True
 
-            # Discover all available Proton/Wine installations
+            # Discover Proton/Wine installations; auto-selection only needs the
+            # highest-priority one, so skip the full enumeration in that case
             logger.info("Searching for Proton or Wine installation...")
-            proton_wine = self._find_proton_installation()
+            auto_select = (
+                not self.preferred_proton_version
+                or self.preferred_proton_version == "auto"
+            )
+            proton_wine = self._find_proton_installation(fast_first=auto_select)
 
             if not proton_wine:
                 # Neither Proton nor Wine found
@@ -462,7 +680,6 @@ class SteamlessIntegration(QObject):
                             logger.info(
                                 f".NET Framework detected via file check: {dll_path}"
                             )
-                            self._create_dotnet_marker(prefix_path)
                             return True
                     except OSError as e:
                         logger.debug(f"Error checking file size: {e}")
@@ -521,51 +738,37 @@ class SteamlessIntegration(QObject):
                 logger.warning("Steamless prefix path not available for .NET check")
                 return False
 
-            # Check if prefix is corrupted
-            if self._is_prefix_corrupted(prefix_path):
-                logger.warning(f"Wine prefix appears corrupted: {prefix_path}")
-                logger.info("Will reinstall .NET in a fresh prefix")
-
             # Check for .NET installation marker
             if self._check_dotnet_marker_exists(prefix_path):
                 logger.info(".NET Framework 4.8 installation confirmed via marker file")
                 return True
 
-            # Query the registry for .NET 4.8 installation
-            env = os.environ.copy()
-            env["WINEDEBUG"] = "-all"
-            env["WINEPREFIX"] = prefix_path
+            # Check if prefix is corrupted
+            if self._is_prefix_corrupted(prefix_path):
+                logger.warning(f"Wine prefix appears corrupted: {prefix_path}")
+                logger.info("Will reinstall .NET in a fresh prefix")
 
+            # Query the registry for .NET 4.8 installation
             # Using Proton or Wine (based on priority order)
-            env["WINE"] = self.wine_command
-            env["WINEARCH"] = self._get_wine_architecture()
-
-            # Determine if we're using Proton or System Wine
-            wine_path_lower = self.wine_command.lower()
-            is_proton = "proton" in wine_path_lower
-
-            if is_proton:
+            env_overrides = {
+                "WINEDEBUG": "-all",
+                "WINEPREFIX": prefix_path,
+                "WINE": self.wine_command,
+                "WINEARCH": self._get_wine_architecture(),
+            }
+
+            if self._is_proton:
                 # Set LD_LIBRARY_PATH for Proton
-                wine_bin_dir = Path(self.wine_command).parent
-                proton_root = wine_bin_dir.parent.parent
-                proton_lib_dir = proton_root / "lib"
-                proton_lib64_dir = proton_root / "lib64"
-
-                ld_library_path = str(proton_lib_dir)
-                if proton_lib64_dir.exists():
-                    ld_library_path = f"{proton_lib64_dir}:{ld_library_path}"
-
-                existing_ld_path = os.environ.get("LD_LIBRARY_PATH", "")
-                if existing_ld_path:
-                    ld_library_path = f"{ld_library_path}:{existing_ld_path}"
-
-                env["LD_LIBRARY_PATH"] = ld_library_path
-                logger.debug(f"Set LD_LIBRARY_PATH for .NET check: {ld_library_path}")
+                env_overrides.update(self._get_proton_env())
+                logger.debug(
+                    f"Set LD_LIBRARY_PATH for .NET check: {env_overrides['LD_LIBRARY_PATH']}"
+                )
             else:
                 # Using System Wine - no need to set LD_LIBRARY_PATH
                 logger.debug(
                     "Using system Wine for .NET check - relying on system library paths"
                 )
+            env = {**os.environ, **env_overrides}
 
             # Query the registry for .NET 4.8
             test_cmd = [
@@ -584,15 +787,17 @@ class SteamlessIntegration(QObject):
                 f"Using WINEPREFIX: {prefix_path}, WINEARCH: {env.get('WINEARCH')}, WINE: {env.get('WINE')}"
             )
 
-            result = subprocess.run(
-                test_cmd, capture_output=True, text=True, timeout=30, env=env
-            )
+            process = self._spawn_wine_process(test_cmd, env)
+
+            # Run the file-based fallback check while Wine answers the registry query
+            dotnet_files_found = self._check_dotnet_files_exist(prefix_path)
+
+            returncode, stdout, stderr = self._collect_wine_process(process, timeout=30)
 
             # Check if Wine doesn't support 32-bit (shouldn't happen with Proton, but keep for safety)
             if (
-                result.stderr
-                and "WINEARCH is set to 'win32' but this is not supported in wow64 mode"
-                in result.stderr
+                "WINEARCH is set to 'win32' but this is not supported in wow64 mode"
+                in stderr
             ):
                 logger.error("Wine does not support 32-bit prefixes (wow64 mode)")
                 self.error.emit(
@@ -604,8 +809,8 @@ class SteamlessIntegration(QObject):
                 )
                 return False
 
-            if result.returncode == 0:
-                output = result.stdout.strip()
+            if returncode == 0:
+                output = stdout.strip()
                 logger.debug(f"Registry query output: {output}")
 
                 # Parse the Release value (expected: "Release    REG_DWORD    528040")
@@ -629,7 +834,7 @@ class SteamlessIntegration(QObject):
                 else:
                     logger.warning("Could not parse Release value from registry")
                     # Fallback: check if .NET files exist
-                    if self._check_dotnet_files_exist(prefix_path):
+                    if dotnet_files_found:
                         logger.info(
                             "Found .NET Framework files, assuming .NET 4.8 is installed"
                         )
@@ -637,14 +842,12 @@ class SteamlessIntegration(QObject):
                         return True
                     return False
             else:
-                stderr_output = (
-                    result.stderr.strip() if result.stderr else "No error output"
-                )
-                logger.warning(f".NET check failed (exit code: {result.returncode})")
+                stderr_output = stderr.strip() or "No error output"
+                logger.warning(f".NET check failed (exit code: {returncode})")
                 logger.warning(f"Registry query failed - stderr: {stderr_output}")
 
                 # Fallback: check if .NET files exist
-                if self._check_dotnet_files_exist(prefix_path):
+                if dotnet_files_found:
                     logger.info("Found .NET Framework 4.8 files, .NET is installed")
                     self._create_dotnet_marker(prefix_path)
                     return True
@@ -678,35 +881,26 @@ class SteamlessIntegration(QObject):
             logger.debug("No Wine prefix needed on Windows")
             return None
 
-        try:
-            # Determine if we're using Proton or System Wine
-            wine_path_lower = self.wine_command.lower() if self.wine_command else ""
-            is_proton = "proton" in wine_path_lower
+        if self._steamless_prefix_path:
+            return self._steamless_prefix_path
 
-            if is_proton:
+        try:
+            if self._is_proton:
                 # Using Proton - use XDG-compliant location for Proton prefix
-                prefix_path = (
-                    Path.home()
-                    / ".local"
-                    / "share"
-                    / "ACCELA"
-                    / "steamless"
-                    / "bin"
-                    / "pfx"
-                )
+                prefix_path = PROTON_STEAMLESS_PREFIX
 
                 # Create directory if it doesn't exist
-                prefix_path.mkdir(parents=True, exist_ok=True)
+                os.makedirs(prefix_path, exist_ok=True)
                 logger.info(f"Using Proton Steamless Wine prefix at: {prefix_path}")
-                return str(prefix_path)
             else:
                 # Using System Wine - use the standard default wine prefix
                 # This allows the .NET check to run in the user's existing Wine prefix
-                prefix_path = str(Path.home() / ".wine")
+                prefix_path = SYSTEM_WINE_PREFIX
                 logger.info(
                     f"Using system Wine - will use default wine prefix ({prefix_path})"
                 )
-                return prefix_path
+            self._steamless_prefix_path = prefix_path
+            return prefix_path
 
         except Exception as e:
             logger.error(f"Failed to create Steamless prefix directory: {e}")
@@ -721,43 +915,37 @@ class SteamlessIntegration(QObject):
             logger.warning("Wine command not available for prefix initialization")
             return False
 
+        # An already-created prefix has its registry hives and system32; checking
+        # those is far cheaper than starting Wine just to validate it
+        if all(
+            os.path.exists(os.path.join(prefix_path, p))
+            for p in ("system.reg", "user.reg", "drive_c/windows/system32")
+        ):
+            logger.debug(f"Wine prefix already initialized: {prefix_path}")
+            return True
+
         try:
             logger.info(f"Initializing Wine prefix: {prefix_path}")
 
-            env = os.environ.copy()
-            env["WINEDEBUG"] = "-all"
-            env["WINEPREFIX"] = prefix_path
-
             # Using Proton or Wine
-            env["WINE"] = self.wine_command
-            env["WINEARCH"] = self._get_wine_architecture()
-
-            # Determine if we're using Proton or System Wine
-            wine_path_lower = self.wine_command.lower()
-            is_proton = "proton" in wine_path_lower
-
-            if is_proton:
+            env_overrides = {
+                "WINEDEBUG": "-all",
+                "WINEPREFIX": prefix_path,
+                "WINE": self.wine_command,
+                "WINEARCH": self._get_wine_architecture(),
+            }
+
+            if self._is_proton:
                 # Set LD_LIBRARY_PATH for Proton
-                wine_bin_dir = Path(self.wine_command).parent
-                proton_root = wine_bin_dir.parent.parent
-                proton_lib_dir = proton_root / "lib"
-                proton_lib64_dir = proton_root / "lib64"
-
-                ld_library_path = str(proton_lib_dir)
-                if proton_lib64_dir.exists():
-                    ld_library_path = f"{proton_lib64_dir}:{ld_library_path}"
-
-                existing_ld_path = os.environ.get("LD_LIBRARY_PATH", "")
-                if existing_ld_path:
-                    ld_library_path = f"{ld_library_path}:{existing_ld_path}"
-
-                env["LD_LIBRARY_PATH"] = ld_library_path
+                env_overrides.update(self._get_proton_env())
+                ld_library_path = env_overrides["LD_LIBRARY_PATH"]
                 logger.debug(f"Set LD_LIBRARY_PATH for prefix init: {ld_library_path}")
             else:
                 # Using System Wine - no need to set LD_LIBRARY_PATH
                 logger.debug(
                     "Using system Wine for prefix init - relying on system library paths"
                 )
+            env = {**os.environ, **env_overrides}
 
             # Initialize the prefix
             logger.debug("Initializing Wine prefix...")
@@ -786,7 +974,16 @@ class SteamlessIntegration(QObject):
             return True
 
     def _get_winetricks_path(self) -> Optional[str]:
-        """Get the path to winetricks script."""
+        """
+        Get the path to winetricks script.
+        Returns cached result if available, otherwise locates it.
+        """
+        if self._winetricks_path is None:
+            self._winetricks_path = self._find_winetricks()
+        return self._winetricks_path
+
+    def _find_winetricks(self) -> Optional[str]:
+        """Locate winetricks: bundled copy first, then the system PATH."""
         # Check local winetricks in deps directory
         # Use resource_path for PyInstaller compatibility
         try:
@@ -855,34 +1052,18 @@ class SteamlessIntegration(QObject):
 
             os.makedirs(prefix_path, exist_ok=True)
 
-            env = os.environ.copy()
-            env["WINEDEBUG"] = "-all"
-            env["WINEPREFIX"] = prefix_path
-
             # Using Proton or Wine
-            env["WINE"] = self.wine_command
-            env["WINEARCH"] = self._get_wine_architecture()
-
-            # Determine if we're using Proton or System Wine
-            wine_path_lower = self.wine_command.lower()
-            is_proton = "proton" in wine_path_lower
-
-            if is_proton:
+            env_overrides = {
+                "WINEDEBUG": "-all",
+                "WINEPREFIX": prefix_path,
+                "WINE": self.wine_command,
+                "WINEARCH": self._get_wine_architecture(),
+            }
+
+            if self._is_proton:
                 # Set LD_LIBRARY_PATH for Proton
-                wine_bin_dir = Path(self.wine_command).parent
-                proton_root = wine_bin_dir.parent.parent
-                proton_lib_dir = proton_root / "lib"
-                proton_lib64_dir = proton_root / "lib64"
-
-                ld_library_path = str(proton_lib_dir)
-                if proton_lib64_dir.exists():
-                    ld_library_path = f"{proton_lib64_dir}:{ld_library_path}"
-
-                existing_ld_path = os.environ.get("LD_LIBRARY_PATH", "")
-                if existing_ld_path:
-                    ld_library_path = f"{ld_library_path}:{existing_ld_path}"
-
-                env["LD_LIBRARY_PATH"] = ld_library_path
+                env_overrides.update(self._get_proton_env())
+                ld_library_path = env_overrides["LD_LIBRARY_PATH"]
                 logger.debug(
                     f"Set LD_LIBRARY_PATH for .NET installation: {ld_library_path}"
                 )
@@ -891,6 +1072,7 @@ class SteamlessIntegration(QObject):
                 logger.debug(
                     "Using system Wine for .NET installation - relying on system library paths"
                 )
+            env = {**os.environ, **env_overrides}
 
             wine_cmd = self.wine_command
 
@@ -923,62 +1105,88 @@ class SteamlessIntegration(QObject):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=False,
-                bufsize=0,
                 env=env,
                 cwd=str(Path.home()),
                 preexec_fn=os.setsid if hasattr(os, "setsid") else None,
             )
 
-            output_lines = []
-            last_progress_time = time.time()
+            # Only the tail is needed for the error check; winetricks can print
+            # megabytes over a 10-15 minute install
+            output_lines = deque(maxlen=10)
+            line_count = 0
+            last_progress_time = time.monotonic()
             no_output_timeout = 60
+            min_emit_interval = 0.5  # Plain lines reach the UI at most twice a second
 
             if process.stdout:
-                while True:
-                    if process.poll() is not None:
-                        break
+                # Block in the kernel until winetricks writes something instead of
+                # sleep-polling; the fd is non-blocking so a read never stalls
+                stdout_fd = process.stdout.fileno()
+                os.set_blocking(stdout_fd, False)
+                pending = b""
+
+                with selectors.DefaultSelector() as selector:
+                    selector.register(stdout_fd, selectors.EVENT_READ)
+                    while True:
+                        if time.monotonic() - last_progress_time > no_output_timeout:
+                            self.progress.emit(
+                                "Still installing .NET (this can take 10-15 minutes)..."
+                            )
+                            last_progress_time = time.monotonic()
 
-                    try:
-                        line_bytes = process.stdout.readline()
-                        if not line_bytes:
-                            if time.time() - last_progress_time > no_output_timeout:
-                                self.progress.emit(
-                                    "Still installing .NET (this can take 10-15 minutes)..."
-                                )
-                                last_progress_time = time.time()
-                            time.sleep(0.1)
+                        # Wine children can inherit the pipe and keep it open after
+                        # winetricks exits, so also wake up once a second to check
+                        exited = process.poll() is not None
+                        if not exited and not selector.select(timeout=1.0):
                             continue
 
                         try:
-                            line = line_bytes.decode("utf-8").strip()
-                            if line:
-                                output_lines.append(line)
-                                if len(output_lines) % 10 == 0 or any(
-                                    keyword in line.lower()
-                                    for keyword in [
-                                        "installing",
-                                        "done",
-                                        "error",
-                                        "success",
-                                        "completed",
-                                        "setting",
-                                        "download",
-                                    ]
-                                ):
-                                    self.progress.emit(f"winetricks: {line}")
-                                    last_progress_time = time.time()
-                        except UnicodeDecodeError:
-                            logger.debug("Skipping non-UTF-8 output from winetricks")
+                            data = os.read(stdout_fd, 65536)
+                        except BlockingIOError:
+                            if exited:
+                                break
                             continue
-                    except Exception as e:
-                        logger.debug(f"Error reading line: {e}")
-                        break
+                        except OSError as e:
+                            logger.debug(f"Error reading line: {e}")
+                            break
+
+                        if data:
+                            lines = (pending + data).split(b"\n")
+                            pending = lines.pop()
+                        else:
+                            # EOF - flush whatever is left without a trailing newline
+                            lines = [pending]
+                            pending = b""
+
+                        for line_bytes in lines:
+                            line_bytes = line_bytes.strip()
+                            if not line_bytes:
+                                continue
+                            # Keep raw bytes; only lines sent to the UI get decoded
+                            output_lines.append(line_bytes)
+                            line_count += 1
+                            # Keyword lines always go through; every 10th line only
+                            # if the UI hasn't been sent anything recently
+                            now = time.monotonic()
+                            is_milestone = (
+                                line_count % 10 == 0
+                                and now - last_progress_time >= min_emit_interval
+                            )
+                            if is_milestone or WINETRICKS_PROGRESS_RE.search(line_bytes):
+                                line = line_bytes.decode("utf-8", errors="replace")
+                                self.progress.emit(f"winetricks: {line}")
+                                last_progress_time = now
+
+                        if not data:
+                            break
 
             process.wait()
 
             # Check for 32-bit support error (shouldn't happen with Proton)
             if process.returncode != 0 and output_lines:
-                error_output = "\n".join(output_lines[-10:])
+                error_output = b"\n".join(output_lines).decode(
+                    "utf-8", errors="replace"
+                )
                 if (
                     "WINEARCH is set to 'win32' but this is not supported in wow64 mode"
                     in error_output
@@ -1025,7 +1233,8 @@ class SteamlessIntegration(QObject):
     def find_game_executables(self, game_directory: str) -> List[dict]:
         """
         Find all executable files in the game directory and subdirectories.
-        Returns a list of .exe files sorted by priority.
+        Returns an unordered list of .exe candidates; callers pick the best ones
+        with heapq.nlargest(..., key=EXE_PRIORITY_KEY).
         """
         try:
             if not os.path.exists(game_directory):
@@ -1033,77 +1242,51 @@ class SteamlessIntegration(QObject):
                 return []
 
             exe_files = []
+            filtered_exes = []  # Bounded sample for the "all filtered" diagnostic
             game_name = os.path.basename(game_directory.rstrip("/"))
+            # Name-matching keys only depend on the directory, not on each exe
+            game_name_keys = self._game_name_keys(game_name)
 
             # Walk through all subdirectories
             logger.debug(f"Searching for executables in: {game_directory}")
-            all_files_found = []
+            scan_stats = {"file_count": 0, "exe_count": 0, "sample": []}
 
             try:
-                for root, dirs, files in os.walk(game_directory):
+                for entry, stat_result in self._scan_exe_entries(
+                    game_directory, scan_stats
+                ):
+                    file = entry.name
+                    file_path = entry.path
                     try:
-                        logger.debug(
-                            f"Scanning directory: {root} - Found {len(files)} files"
-                        )
-                        all_files_found.extend(files)
-
-                        for file in files:
-                            try:
-                                if file.lower().endswith(".exe"):
-                                    file_path = os.path.join(root, file)
-                                    logger.debug(f"Found executable: {file_path}")
+                        logger.debug(f"Found executable: {file_path}")
+                        file_size = stat_result.st_size
 
-                                    # Skip system/uninstaller files
-                                    if self._should_skip_exe(file, file_path):
-                                        logger.info(
-                                            f"Skipping executable (system/utility): {file}"
-                                        )
-                                        continue
-
-                                    # Get file size for priority calculation and size check
-                                    try:
-                                        file_size = os.path.getsize(file_path)
-                                        # Additional check: ensure the file is not a broken symlink
-                                        if file_size == 0 and os.path.islink(file_path):
-                                            logger.warning(
-                                                f"Skipping broken symlink: {file_path}"
-                                            )
-                                            continue
-                                    except (OSError, FileNotFoundError) as e:
-                                        logger.warning(
-                                            f"Cannot access file {file_path}: {e}"
-                                        )
-                                        # Skip files we can't read (permissions, broken symlinks, etc.)
-                                        continue
+                        # Additional check: ensure the file is not a broken symlink
+                        if file_size == 0 and entry.is_symlink():
+                            logger.warning(f"Skipping broken symlink: {file_path}")
+                            continue
 
-                                    # Skip very small files (likely utilities)
-                                    if file_size < 100 * 1024:  # < 100KB
-                                        logger.info(
-                                            f"Skipping executable (too small, likely utility): {file} ({file_size} bytes)"
-                                        )
-                                        continue
+                        # Skip system/uninstaller files and very small utilities
+                        if self._should_skip_exe(file, file_path, file_size):
+                            logger.info(
+                                f"Skipping executable (system/utility or too small): {file} ({file_size} bytes)"
+                            )
+                            if len(filtered_exes) < 50:
+                                filtered_exes.append(file_path)
+                            continue
 
-                                    exe_files.append(
-                                        {
-                                            "path": file_path,
-                                            "name": file,
-                                            "size": file_size,
-                                            "priority": self._calculate_exe_priority(
-                                                file, game_name, file_size
-                                            ),
-                                        }
-                                    )
-                                else:
-                                    # Log non-exe files for debugging
-                                    if file.lower().endswith((".dll", ".so", ".bin")):
-                                        logger.debug(f"Found binary file: {file}")
-                            except Exception as e:
-                                logger.warning(
-                                    f"Error processing file {file} in {root}: {e}"
-                                )
-                                continue
+                        exe_files.append(
+                            {
+                                "path": file_path,
+                                "name": file,
+                                "size": file_size,
+                                "priority": self._calculate_exe_priority(
+                                    file, game_name_keys, file_size
+                                ),
+                            }
+                        )
                     except Exception as e:
-                        logger.warning(f"Error scanning directory {root}: {e}")
+                        logger.warning(f"Error processing file {file_path}: {e}")
                         continue
             except Exception as e:
                 logger.error(
@@ -1112,30 +1295,20 @@ class SteamlessIntegration(QObject):
                 return []
 
             # Log summary of what was found
-            exe_count = len([f for f in all_files_found if f.lower().endswith(".exe")])
+            exe_count = scan_stats["exe_count"]
             logger.debug(
-                f"Directory scan complete. Total files: {len(all_files_found)}, EXE files: {exe_count}, After filtering: {len(exe_files)}"
+                f"Directory scan complete. Total files: {scan_stats['file_count']}, EXE files: {exe_count}, After filtering: {len(exe_files)}"
             )
 
             if exe_count == 0:
                 logger.warning(f"No .exe files found in {game_directory}")
-                logger.debug(f"First 10 files found: {all_files_found[:10]}")
+                logger.debug(f"First 10 files found: {scan_stats['sample']}")
             elif len(exe_files) == 0:
                 logger.warning(
                     f"Found {exe_count} .exe files but all were filtered out"
                 )
-                try:
-                    for root, dirs, files in os.walk(game_directory):
-                        for file in files:
-                            if file.lower().endswith(".exe"):
-                                logger.debug(
-                                    f"Filtered EXE: {os.path.join(root, file)}"
-                                )
-                except Exception:
-                    pass  # Don't crash on logging errors
-
-            # Sort by priority (higher first)
-            exe_files.sort(key=lambda x: x["priority"], reverse=True)
+                for filtered_path in filtered_exes:
+                    logger.debug(f"Filtered EXE: {filtered_path}")
 
             if len(exe_files) == 0:
                 logger.warning(f"No executables found in {game_directory}")
@@ -1143,78 +1316,162 @@ class SteamlessIntegration(QObject):
                 logger.debug(
                     f"Found {len(exe_files)} executable(s) in {game_directory}"
                 )
-                for exe in exe_files[:3]:  # Log top 3 candidates only in debug
+                # Log top 3 candidates only in debug
+                for exe in heapq.nlargest(3, exe_files, key=EXE_PRIORITY_KEY):
                     logger.debug(
                         f"  - {exe['name']} ({exe['size']} bytes, priority: {exe['priority']})"
                     )
 
-            return exe_files  # Return full dictionaries with path, name, size, priority
+            # Return full dictionaries with path, name, size, priority
+            return list(exe_files)
 
         except Exception as e:
             logger.error(f"Critical error in find_game_executables: {e}", exc_info=True)
             return []
 
-    def _should_skip_exe(self, filename: str, file_path: Optional[str] = None) -> bool:
-        """Check if an executable should be skipped based on name patterns."""
-        try:
-            skip_patterns = [
-                r"^unins.*\.exe$",  # uninstallers
-                r"^setup.*\.exe$",  # installers
-                r"^config.*\.exe$",  # configuration tools
-                r"^launcher.*\.exe$",  # launchers (usually not the main game)
-                r"^updater.*\.exe$",  # updaters
-                r"^patch.*\.exe$",  # patches
-                r"^redist.*\.exe$",  # redistributables
-                r"^vcredist.*\.exe$",  # Visual C++ redistributables
-                r"^dxsetup.*\.exe$",  # DirectX setup
-                r"^physx.*\.exe$",  # PhysX installers
-                r".*crash.*\.exe$",  # crash handlers
-                r".*handler.*\.exe$",  # handlers
-                r"^unity.*\.exe$",  # Unity crash handlers and utilities
-                r".*unity.*\.exe$",  # Unity-related utilities
-                r".*\.original\.exe$",  # Steamless backup files
-            ]
+    def _scan_exe_entries(self, directory: str, scan_stats: dict) -> list:
+        """
+        Collect (DirEntry, stat_result) for every .exe below directory.
+        The directory's own level is read here; when it has enough subdirectories
+        their subtrees are walked on a small thread pool so readdir/stat latency
+        overlaps, otherwise sequentially. Results keep the sequential order.
+        """
+        found, subdirs = self._scan_exe_dir(directory, scan_stats)
+
+        if len(subdirs) <= 2:
+            for subdir in subdirs:
+                found.extend(self._iter_exe_entries(subdir, scan_stats))
+            return found
+
+        with ThreadPoolExecutor(
+            max_workers=min(EXE_SCAN_WORKERS, len(subdirs))
+        ) as executor:
+            results = list(executor.map(self._collect_exe_entries, subdirs))
+
+        # Each worker has its own stats; merge them in subdirectory order
+        for entries, subdir_stats in results:
+            found.extend(entries)
+            scan_stats["file_count"] += subdir_stats["file_count"]
+            scan_stats["exe_count"] += subdir_stats["exe_count"]
+            room = 10 - len(scan_stats["sample"])
+            if room > 0:
+                scan_stats["sample"].extend(subdir_stats["sample"][:room])
+        return found
+
+    def _collect_exe_entries(self, directory: str) -> Tuple[list, dict]:
+        """Walk one subtree with its own scan_stats (thread pool worker)."""
+        scan_stats = {"file_count": 0, "exe_count": 0, "sample": []}
+        return list(self._iter_exe_entries(directory, scan_stats)), scan_stats
+
+    def _iter_exe_entries(self, directory: str, scan_stats: dict):
+        """
+        Recursively yield (DirEntry, stat_result) for every .exe below directory.
+        """
+        found, subdirs = self._scan_exe_dir(directory, scan_stats)
+        yield from found
 
-            filename_lower = filename.lower()
-            for pattern in skip_patterns:
-                if re.match(pattern, filename_lower):
-                    return True
+        for subdir in subdirs:
+            yield from self._iter_exe_entries(subdir, scan_stats)
 
-            # Skip very small files (likely utilities) - but allow main game executables
+    def _scan_exe_dir(self, directory: str, scan_stats: dict) -> Tuple[list, list]:
+        """
+        Read one directory level: returns its (DirEntry, stat_result) .exe pairs
+        and the subdirectories to descend into.
+        Directory/file types come from readdir, so only .exe files are stat'ed,
+        and each of them exactly once. Like os.walk, symlinked directories are
+        not descended into, and neither are PRUNE_EXE_DIRS. scan_stats collects
+        counts for the summary log.
+        """
+        found = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"Error scanning directory {directory}: {e}")
+            return found, subdirs
+
+        file_count = 0
+        for entry in entries:
             try:
-                # Use full path if available, otherwise assume it's a relative path
-                path_to_check = file_path if file_path else filename
-                file_size = os.path.getsize(path_to_check)
-                # Only skip if smaller than 100KB AND not matching game name patterns
-                if file_size < 100 * 1024:  # < 100KB
-                    return True
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.lower() in PRUNE_EXE_DIRS:
+                        logger.debug(f"Skipping redistributable directory: {entry.path}")
+                    else:
+                        subdirs.append(entry.path)
+                    continue
             except OSError:
-                # Only skip if we can't get the file size AND it's not a likely main executable
-                # Main game executables should exist, so this might be a broken symlink
-                if file_path is None:
-                    return True
-                # If we have a full path but can't read it, log but don't skip (might be permission issue)
-                logger.debug(f"Cannot read file size for {filename}, but not skipping")
-                return False
+                continue
+
+            file_count += 1
+            if len(scan_stats["sample"]) < 10:
+                scan_stats["sample"].append(entry.name)
+
+            name_lower = entry.name.lower()
+            if not name_lower.endswith(".exe"):
+                # Log non-exe files for debugging
+                if name_lower.endswith((".dll", ".so", ".bin")):
+                    logger.debug(f"Found binary file: {entry.name}")
+                continue
+
+            scan_stats["exe_count"] += 1
+            try:
+                # Follows symlinks like os.path.getsize; broken links raise here
+                stat_result = entry.stat()
+            except OSError as e:
+                logger.warning(f"Cannot access file {entry.path}: {e}")
+                # Skip files we can't read (permissions, broken symlinks, etc.)
+                continue
+            found.append((entry, stat_result))
+
+        scan_stats["file_count"] += file_count
+        logger.debug(f"Scanning directory: {directory} - Found {file_count} files")
+        return found, subdirs
+
+    def _should_skip_exe(
+        self, filename: str, file_path: Optional[str], file_size: int
+    ) -> bool:
+        """
+        Check if an executable should be skipped based on name patterns or size.
+        file_size comes from the caller's stat, so no extra syscall is made here.
+        """
+        try:
+            if SKIP_EXE_RE.match(filename):
+                return True
+
+            # Skip very small files (likely utilities)
+            if file_size < 100 * 1024:  # < 100KB
+                return True
 
             return False
         except Exception as e:
             logger.warning(f"Error in _should_skip_exe for {filename}: {e}")
             return False  # Don't skip on error - let it be processed
 
+    def _game_name_keys(self, game_name: str) -> Tuple[str, str]:
+        """
+        Get the lowercase forms of the game name that executables are matched
+        against: alphanumerics only, and with spaces removed.
+        """
+        game_name_lower = game_name.lower()
+        game_name_clean = "".join(c for c in game_name_lower if c.isalnum())
+        game_name_with_spaces = game_name_lower.replace(" ", "")
+        return game_name_clean, game_name_with_spaces
+
     def _calculate_exe_priority(
-        self, filename: str, game_name: str, file_size: int
+        self, filename: str, game_name_keys: Tuple[str, str], file_size: int
     ) -> int:
-        """Calculate priority score for an executable file."""
+        """
+        Calculate priority score for an executable file.
+        game_name_keys comes from _game_name_keys(), computed once per scan.
+        """
         try:
             filename_lower = filename.lower()
-            game_name_lower = game_name.lower()
 
             priority = 0
 
             # High priority: exact match with game name (remove spaces and special chars)
-            game_name_clean = "".join(c for c in game_name_lower if c.isalnum())
-            game_name_with_spaces = game_name_lower.replace(" ", "")
+            game_name_clean, game_name_with_spaces = game_name_keys
 
             if filename_lower.startswith(game_name_clean):
                 priority += 100
@@ -1238,26 +1495,11 @@ class SteamlessIntegration(QObject):
             elif file_size > 5 * 1024 * 1024:  # > 5MB
                 priority += 10
 
-            # Penalty for common non-game executables
-            if any(
-                word in filename_lower
-                for word in ["editor", "tool", "config", "settings"]
-            ):
-                priority -= 20
-
-            # High penalty for crash handlers and utilities
-            if any(
-                word in filename_lower
-                for word in ["crash", "handler", "debug", "unitycrash"]
-            ):
-                priority -= 50
-
-            # Very high penalty for Unity system files (extra safety)
-            if any(
-                word in filename_lower
-                for word in ["unityplayer", "unity crash", "crash handler"]
-            ):
-                priority -= 100  # Effectively exclude these files
+            # Penalties for non-game executables, crash handlers/utilities and
+            # Unity system files (the last one effectively excludes them)
+            for penalty_re, penalty in EXE_PRIORITY_PENALTIES:
+                if penalty_re.search(filename_lower):
+                    priority -= penalty
 
             return max(0, priority)
         except Exception as e:
@@ -1282,30 +1524,44 @@ class SteamlessIntegration(QObject):
                 )
                 return False
 
-            # Initialize Wine prefix to prevent configuration dialogs
-            # Note: On Windows, _get_steamless_prefix_path() returns None, so this is skipped
+            # Note: On Windows, _get_steamless_prefix_path() returns None
             prefix_path = self._get_steamless_prefix_path()
-            if prefix_path:
-                self.progress.emit("Initializing Wine environment...")
-                if not self._initialize_wine_prefix(prefix_path):
-                    logger.warning(
-                        "Wine prefix initialization failed, but continuing..."
-                    )
-            else:
-                logger.debug("No Wine prefix needed (running on Windows)")
 
-            # Check and install .NET Framework if needed
-            self.progress.emit("Checking .NET Framework 4.8 availability...")
-            self.dotnet_available = self._check_dotnet_availability()
+            # A prefix with the .NET marker and a registry is already provisioned,
+            # so skip the Wine prefix init and the .NET check subprocesses
+            if not self._prefix_ready and prefix_path:
+                self._prefix_ready = self._check_dotnet_marker_exists(
+                    prefix_path
+                ) and os.path.exists(os.path.join(prefix_path, "system.reg"))
 
-            if not self.dotnet_available:
-                self.progress.emit(".NET Framework 4.8 not found in prefix")
-                self.progress.emit(
-                    "Installing .NET Framework 4.8 (first-time installation - this may take 10-20 minutes)..."
-                )
-                if not self._install_dotnet():
-                    return False
+            if self._prefix_ready:
+                logger.debug("Wine prefix and .NET Framework 4.8 already set up")
                 self.dotnet_available = True
+            else:
+                # Initialize Wine prefix to prevent configuration dialogs
+                if prefix_path:
+                    self.progress.emit("Initializing Wine environment...")
+                    if not self._initialize_wine_prefix(prefix_path):
+                        logger.warning(
+                            "Wine prefix initialization failed, but continuing..."
+                        )
+                else:
+                    logger.debug("No Wine prefix needed (running on Windows)")
+
+                # Check and install .NET Framework if needed
+                self.progress.emit("Checking .NET Framework 4.8 availability...")
+                self.dotnet_available = self._check_dotnet_availability()
+
+                if not self.dotnet_available:
+                    self.progress.emit(".NET Framework 4.8 not found in prefix")
+                    self.progress.emit(
+                        "Installing .NET Framework 4.8 (first-time installation - this may take 10-20 minutes)..."
+                    )
+                    if not self._install_dotnet():
+                        return False
+                    self.dotnet_available = True
+
+                self._prefix_ready = True
 
             if not os.path.exists(self.steamless_path):
                 self.error.emit(f"Steamless directory not found: {self.steamless_path}")
@@ -1315,6 +1571,7 @@ class SteamlessIntegration(QObject):
             if not os.path.exists(steamless_cli):
                 self.error.emit(f"Steamless.CLI.exe not found: {steamless_cli}")
                 return False
+            self._steamless_cli_path = steamless_cli
 
             # Validate game_directory is actually a directory
             if not os.path.isdir(game_directory):
@@ -1338,19 +1595,27 @@ class SteamlessIntegration(QObject):
                 self.error.emit("No suitable game executables found.")
                 return False
 
+            # Wine/Proton environment is the same for every candidate
+            self._steamless_env = (
+                None if self.is_windows else self._prepare_steamless_env()
+            )
+
             # Try executables in order of priority until one works
             max_attempts = min(3, len(exe_files))  # Try up to 3 executables
 
             self.progress.emit(f"Found {len(exe_files)} executable(s) to evaluate")
 
+            # Only the top 5 are ever shown or tried, so skip a full sort
+            top_exes = heapq.nlargest(5, exe_files, key=EXE_PRIORITY_KEY)
+
             # Log all candidates for user transparency
-            for i, exe_info in enumerate(exe_files[:5]):  # Show top 5 candidates
+            for i, exe_info in enumerate(top_exes):  # Show top 5 candidates
                 self.progress.emit(
                     f"  Candidate {i + 1}: {exe_info['name']} (priority: {exe_info['priority']}, size: {exe_info['size']:,} bytes)"
                 )
 
             for i in range(max_attempts):
-                exe_info = exe_files[i]
+                exe_info = top_exes[i]
                 target_exe = exe_info["path"]
                 exe_name = exe_info["name"]
                 priority = exe_info["priority"]
@@ -1359,6 +1624,14 @@ class SteamlessIntegration(QObject):
                     f"Attempt {i + 1}/{max_attempts}: Processing {exe_name} (priority: {priority})"
                 )
 
+                # Steamless can only unpack files with a SteamStub .bind section;
+                # skip the Wine/Steamless launch for anything without one
+                if not self._has_steamstub_section(target_exe):
+                    self.progress.emit(
+                        f"No SteamStub section in {exe_name}, trying next..."
+                    )
+                    continue
+
                 if self._run_steamless_on_exe(target_exe):
                     self.progress.emit(f"Successfully processed: {exe_name}")
                     return True
@@ -1377,6 +1650,140 @@ class SteamlessIntegration(QObject):
             self.error.emit(f"Unexpected error during Steamless processing: {str(e)}")
             return False
 
+    def _get_steamless_env_overrides(self) -> dict:
+        """
+        Get the Wine/Proton environment overrides for Steamless runs.
+        The prefix, architecture, Proton library path and wineserver lookup
+        never change for this instance, so they are resolved once and cached.
+        """
+        if self._steamless_env_overrides is not None:
+            return self._steamless_env_overrides
+
+        overrides = {"WINEDEBUG": "-all"}
+        prefix_path = self._get_steamless_prefix_path()
+        if prefix_path:
+            overrides["WINEPREFIX"] = prefix_path
+            logger.debug(f"Using WINEPREFIX: {prefix_path}")
+
+        # Using Proton or Wine
+        overrides["WINE"] = self.wine_command
+        overrides["WINEARCH"] = self._get_wine_architecture()
+
+        if self._is_proton:
+            # Set LD_LIBRARY_PATH for Proton
+            overrides.update(self._get_proton_env())
+            logger.info(
+                f"Set LD_LIBRARY_PATH for Proton: {overrides['LD_LIBRARY_PATH']}"
+            )
+
+            wine_bin_dir = Path(self.wine_command).parent
+
+            # Find Proton's wineserver
+            wineserver_path = str(wine_bin_dir / "wineserver")
+
+            if os.path.exists(wineserver_path):
+                overrides["WINESERVER"] = wineserver_path
+                logger.info(f"Using Proton wineserver: {wineserver_path}")
+            else:
+                logger.warning(
+                    f"Proton wineserver not found at: {wineserver_path}"
+                )
+                logger.warning("This may cause version mismatch errors")
+                # Try alternative location
+                alt_wineserver = str(
+                    wine_bin_dir.parent / "dist" / "bin" / "wineserver"
+                )
+                if os.path.exists(alt_wineserver):
+                    overrides["WINESERVER"] = alt_wineserver
+                    logger.info(
+                        f"Using alternative Proton wineserver: {alt_wineserver}"
+                    )
+        else:
+            # Using System Wine - let it find its own libraries and wineserver
+            logger.info("Using system Wine - relying on system library paths")
+
+        self._steamless_env_overrides = overrides
+        return overrides
+
+    def _has_steamstub_section(self, exe_path: str) -> bool:
+        """
+        Check the PE section table for SteamStub's ".bind" section, which every
+        SteamStub variant Steamless handles adds. Only the headers are read.
+        Returns True when the file can't be parsed, leaving the call to Steamless.
+        """
+        try:
+            with open(exe_path, "rb") as f:
+                dos_header = f.read(64)
+                if len(dos_header) < 64 or dos_header[:2] != b"MZ":
+                    return True
+                (pe_offset,) = struct.unpack_from("<I", dos_header, 0x3C)
+
+                f.seek(pe_offset)
+                pe_header = f.read(24)  # "PE\0\0" + COFF file header
+                if len(pe_header) < 24 or pe_header[:4] != b"PE\0\0":
+                    return True
+                (num_sections,) = struct.unpack_from("<H", pe_header, 6)
+                (optional_header_size,) = struct.unpack_from("<H", pe_header, 20)
+
+                f.seek(pe_offset + 24 + optional_header_size)
+                section_table = f.read(40 * num_sections)
+        except (OSError, struct.error) as e:
+            logger.debug(f"Could not read PE headers of {exe_path}: {e}")
+            return True
+
+        # A short read means a truncated or bogus section table, not an
+        # absence of .bind
+        if len(section_table) < 40 * num_sections:
+            logger.debug(f"Truncated PE section table in {exe_path}")
+            return True
+
+        for offset in range(0, len(section_table) - 39, 40):
+            if section_table[offset : offset + 8].rstrip(b"\0") == b".bind":
+                return True
+        logger.debug(f"No .bind section found in {exe_path}")
+        return False
+
+    def _prepare_steamless_env(self) -> dict:
+        """
+        Build the Wine/Proton environment for Steamless runs and make sure no
+        stale wineserver is left over. Identical for every executable tried.
+        """
+        overrides = self._get_steamless_env_overrides()
+        env = os.environ | overrides
+
+        # Kill existing wineserver processes to prevent a version mismatch with
+        # Proton's own wineserver, or to ensure a clean state with system Wine
+        if "WINESERVER" in overrides or not self._is_proton:
+            self._kill_wineservers()
+
+        return env
+
+    def _kill_wineservers(self):
+        """
+        SIGKILL every running wineserver. Scans /proc directly instead of
+        spawning pkill; /proc/<pid>/comm is a single short read per process.
+        """
+        killed = 0
+        try:
+            pids = [pid for pid in os.listdir("/proc") if pid.isdigit()]
+        except OSError as e:
+            logger.debug(f"Error listing processes: {e}")
+            return
+
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/comm", "rb") as f:
+                    comm = f.read().rstrip()
+                if comm.startswith(b"wineserver"):
+                    os.kill(int(pid), signal.SIGKILL)
+                    killed += 1
+            except (OSError, ValueError):
+                # Process exited meanwhile or belongs to another user
+                continue
+
+        if killed:
+            logger.info(f"Killed {killed} existing wineserver process(es)")
+
     def _run_steamless_on_exe(self, exe_path: str) -> bool:
         """Run Steamless CLI on a specific executable."""
         try:
@@ -1386,126 +1793,31 @@ class SteamlessIntegration(QObject):
                 return False
 
             steamless_dir = self.steamless_path
-            steamless_cli = os.path.join(steamless_dir, "Steamless.CLI.exe")
+            steamless_cli = self._steamless_cli_path or os.path.join(
+                steamless_dir, "Steamless.CLI.exe"
+            )
 
-            # Prepare environment
-            env = None
+            # Environment is prepared once per process_game_with_steamless call
+            env = self._steamless_env
             if not self.is_windows:
-                env = os.environ.copy()
-                env["WINEDEBUG"] = "-all"
-                prefix_path = self._get_steamless_prefix_path()
-                if prefix_path:
-                    env["WINEPREFIX"] = prefix_path
-                    logger.debug(f"Using WINEPREFIX: {prefix_path}")
-
                 # Prepare command for Linux (Proton or Wine)
                 if not self.wine_command:
                     self.error.emit("Proton/Wine not available")
                     return False
 
+                if env is None:
+                    env = self._prepare_steamless_env()
+
                 cmd = [
                     self.wine_command,
                     steamless_cli,
                     "-f",
                     target_path,
-                    "--quiet",
-                    "--realign",
-                    "--recalcchecksum",
+                    *STEAMLESS_ARGS,
                 ]
-
-                # Using Proton or Wine
-                env["WINE"] = self.wine_command
-                env["WINEARCH"] = self._get_wine_architecture()
-
-                # Determine if we're using Proton or System Wine
-                wine_path_lower = self.wine_command.lower()
-                is_proton = "proton" in wine_path_lower
-
-                if is_proton:
-                    # Set LD_LIBRARY_PATH for Proton
-                    wine_bin_dir = Path(self.wine_command).parent
-                    proton_root = wine_bin_dir.parent.parent
-                    proton_lib_dir = proton_root / "lib"
-                    proton_lib64_dir = proton_root / "lib64"
-
-                    ld_library_path = str(proton_lib_dir)
-                    if proton_lib64_dir.exists():
-                        ld_library_path = f"{proton_lib64_dir}:{ld_library_path}"
-
-                    existing_ld_path = os.environ.get("LD_LIBRARY_PATH", "")
-                    if existing_ld_path:
-                        ld_library_path = f"{ld_library_path}:{existing_ld_path}"
-
-                    env["LD_LIBRARY_PATH"] = ld_library_path
-                    logger.info(f"Set LD_LIBRARY_PATH for Proton: {ld_library_path}")
-
-                    # Find Proton's wineserver
-                    wineserver_path = str(wine_bin_dir / "wineserver")
-
-                    if os.path.exists(wineserver_path):
-                        env["WINESERVER"] = wineserver_path
-                        logger.info(f"Using Proton wineserver: {wineserver_path}")
-
-                        # Kill existing wineserver processes to prevent version mismatch
-                        try:
-                            result = subprocess.run(
-                                ["pkill", "-9", "-f", "wineserver"],
-                                capture_output=True,
-                                text=True,
-                                timeout=5,
-                            )
-                            if result.returncode == 0:
-                                logger.info("Killed existing wineserver processes")
-                        except Exception as e:
-                            logger.debug(f"Error killing wineserver: {e}")
-                    else:
-                        logger.warning(
-                            f"Proton wineserver not found at: {wineserver_path}"
-                        )
-                        logger.warning("This may cause version mismatch errors")
-                        # Try alternative location
-                        alt_wineserver = str(
-                            wine_bin_dir.parent / "dist" / "bin" / "wineserver"
-                        )
-                        if os.path.exists(alt_wineserver):
-                            env["WINESERVER"] = alt_wineserver
-                            logger.info(
-                                f"Using alternative Proton wineserver: {alt_wineserver}"
-                            )
-
-                            # Kill existing wineservers
-                            try:
-                                subprocess.run(
-                                    ["pkill", "-9", "-f", "wineserver"],
-                                    capture_output=True,
-                                    timeout=5,
-                                )
-                                logger.info("Killed existing wineserver processes")
-                            except Exception:
-                                pass
-                else:
-                    # Using System Wine - let it find its own libraries and wineserver
-                    logger.info("Using system Wine - relying on system library paths")
-                    # Kill any existing wineserver processes to ensure clean state
-                    try:
-                        subprocess.run(
-                            ["pkill", "-9", "-f", "wineserver"],
-                            capture_output=True,
-                            timeout=5,
-                        )
-                        logger.info("Killed existing wineserver processes")
-                    except Exception:
-                        pass  # Don't fail if we can't kill wineservers
             else:
                 # Prepare command for Windows
-                cmd = [
-                    steamless_cli,
-                    "-f",
-                    target_path,
-                    "--quiet",
-                    "--realign",
-                    "--recalcchecksum",
-                ]
+                cmd = [steamless_cli, "-f", target_path, *STEAMLESS_ARGS]
 
             self.progress.emit(f"Running Steamless: {' '.join(cmd)}")
 
@@ -1521,16 +1833,10 @@ class SteamlessIntegration(QObject):
                     cwd=steamless_dir,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    encoding="utf-8",
                     bufsize=0,
                     creationflags=creationflags,
                 )
             else:
-                # Determine if we're using Proton or System Wine
-                wine_path_lower = self.wine_command.lower()
-                is_proton = "proton" in wine_path_lower
-
                 # Use setsid for both Proton and Wine (it helps with process management)
                 preexec = os.setsid if hasattr(os, "setsid") else None
 
@@ -1539,16 +1845,14 @@ class SteamlessIntegration(QObject):
                     cwd=steamless_dir,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    encoding="utf-8",
+                    bufsize=0,
                     env=env,
                     preexec_fn=preexec,
                 )
 
             # Store process for cleanup
-            self._process_mutex.lock()
-            self._current_process = process
-            self._process_mutex.unlock()
+            with self._process_lock:
+                self._current_process = process
 
             # Monitor output
             has_drm = False
@@ -1561,60 +1865,61 @@ class SteamlessIntegration(QObject):
             )
             logger.debug(f"Process stdout exists: {process.stdout is not None}")
 
-            # Small delay to let process start and produce initial output
-            import time
-
-            time.sleep(0.1)
-
             if process.stdout:
+                # Lines are sent to the UI thread in batches rather than one
+                # queued signal per line
+                emit = self.progress.emit
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                pending_progress = []
                 try:
-                    for line in iter(process.stdout.readline, ""):
+                    for line_bytes in self._iter_output_lines(process):
                         if self._current_process != process:
                             logger.debug(
                                 "Process was terminated, stopping output monitoring"
                             )
                             break
 
-                        if not line:
-                            break
+                        # End of a read chunk or an idle wait: show what we have
+                        # now instead of holding it until the next line arrives
+                        if line_bytes is None:
+                            if pending_progress:
+                                emit("\n".join(pending_progress))
+                                pending_progress.clear()
+                            continue
 
-                        line = line.strip()
-                        if line:
+                        # Classify on the raw bytes so filtered Wine noise is
+                        # never decoded unless it is actually logged
+                        line_bytes = line_bytes.strip()
+                        if line_bytes.startswith(b"wine:"):
                             # Filter out Wine messages
-                            if line.startswith("wine:"):
+                            if debug_enabled:
+                                line = line_bytes.decode("utf-8", errors="replace")
                                 logger.debug(f"Wine output filtered: {line}")
-                            elif line.startswith("Steamless:"):
-                                self.progress.emit(f"{line}")
-                                output_lines.append(line)
-                            elif line.startswith("[Steamless]"):
-                                self.progress.emit(f"{line}")
-                                output_lines.append(line)
-                            else:
-                                self.progress.emit(f"{line}")
-                                output_lines.append(line)
+                        elif line_bytes:
+                            # Steamless:, [Steamless] and any other output
+                            line = line_bytes.decode("utf-8", errors="replace")
+                            pending_progress.append(line)
+                            output_lines.append(line)
 
                         # Check for DRM detection
-                        if (
-                            "steam stub" in line.lower()
-                            or "drift" in line.lower()
-                            or "steamstub" in line.lower()
-                            or "packed with" in line.lower()
-                        ):
+                        if STEAMLESS_DRM_RE.search(line_bytes):
                             has_drm = True
 
                         # Check for unpacked file creation
-                        if (
-                            "unpacked file saved to disk" in line.lower()
-                            or "unpacked file saved as" in line.lower()
-                            or "successfully unpacked file" in line.lower()
-                            or ("unpacked" in line.lower() and ".exe" in line.lower())
-                        ):
+                        if STEAMLESS_UNPACKED_RE.search(line_bytes):
                             unpacked_created = True
 
-                except ValueError as e:
+                        if len(pending_progress) >= 32:
+                            emit("\n".join(pending_progress))
+                            pending_progress.clear()
+
+                except (ValueError, OSError) as e:
                     logger.debug(f"stdout closed during read: {e}")
                 except Exception as e:
                     logger.debug(f"Error reading process output: {e}")
+                finally:
+                    if pending_progress:
+                        emit("\n".join(pending_progress))
 
             process.wait()
 
@@ -1671,59 +1976,130 @@ class SteamlessIntegration(QObject):
             return False
         finally:
             # Clean up process reference
-            self._process_mutex.lock()
-            self._current_process = None
-            self._process_mutex.unlock()
+            with self._process_lock:
+                self._current_process = None
+
+    def _iter_output_lines(self, process):
+        """
+        Yield the raw output lines of process, reading its stdout pipe in large
+        chunks with os.read() instead of one readline() call per line.
+        None is yielded after each chunk's lines and on every idle selector
+        timeout, so the consumer can flush batched output.
+        On POSIX the pipe is non-blocking and waited on with a selector together
+        with a wakeup pipe, so terminate_process() stops the loop immediately
+        without having to close stdout under us.
+        """
+        stdout_fd = process.stdout.fileno()
+        pending = b""
+
+        if self.is_windows:
+            # selectors only support sockets on Windows; a blocking read still
+            # returns whatever the pipe holds rather than waiting for a full line
+            while True:
+                data = os.read(stdout_fd, 65536)
+                if not data:
+                    break
+                lines = (pending + data).split(b"\n")
+                pending = lines.pop()
+                yield from lines
+                yield None
+        else:
+            os.set_blocking(stdout_fd, False)
+            wakeup_r, wakeup_w = os.pipe()
+            os.set_blocking(wakeup_w, False)
+            with self._process_lock:
+                self._wakeup_w = wakeup_w
+            try:
+                with selectors.DefaultSelector() as selector:
+                    selector.register(stdout_fd, selectors.EVENT_READ)
+                    selector.register(wakeup_r, selectors.EVENT_READ)
+                    while True:
+                        events = selector.select(timeout=0.25)
+                        if not events:
+                            # Nothing left to read and the process is gone; Wine
+                            # children may still hold the pipe open, so don't
+                            # wait for EOF
+                            if process.poll() is not None:
+                                break
+                            yield None
+                            continue
+                        if any(key.fd == wakeup_r for key, _ in events):
+                            logger.debug("Output monitoring woken up for termination")
+                            break
+                        try:
+                            data = os.read(stdout_fd, 65536)
+                        except BlockingIOError:
+                            continue
+                        if not data:
+                            break
+                        lines = (pending + data).split(b"\n")
+                        pending = lines.pop()
+                        yield from lines
+                        yield None
+            finally:
+                # Close under the lock so terminate_process never writes to a
+                # closed (or reused) descriptor
+                with self._process_lock:
+                    self._wakeup_w = None
+                os.close(wakeup_r)
+                os.close(wakeup_w)
+
+        # EOF - flush whatever is left without a trailing newline
+        if pending:
+            yield pending
 
     def terminate_process(self):
         """Terminate any running Steamless process (thread-safe)."""
-        self._process_mutex.lock()
-        try:
+        # Only the handoff needs the lock; terminating and waiting happen outside
+        # it so the worker thread's own cleanup is never blocked behind us
+        with self._process_lock:
             process = self._current_process
-            if process and process.poll() is None:
-                logger.info("Terminating running Steamless process...")
+            self._current_process = None
+            if self._wakeup_w is not None:
+                # Wake the output reader (POSIX) so it stops right away
                 try:
-                    # CRITICAL: Close stdout first to unblock any readline() calls
-                    # This prevents deadlock where the thread is waiting on I/O
-                    if process.stdout:
-                        try:
-                            process.stdout.close()
-                        except Exception:
-                            pass
-                        # Also close stderr if it's separate
-                        if hasattr(process, "stderr") and process.stderr:
-                            try:
-                                process.stderr.close()
-                            except Exception:
-                                pass
+                    os.write(self._wakeup_w, b"\0")
+                except OSError:
+                    pass  # Pipe full - the reader is already being woken up
+
+        if not process or process.poll() is not None:
+            # Process already finished or doesn't exist
+            return
 
-                    # Now terminate the process
-                    process.terminate()
-                    # Give it a moment to terminate gracefully
+        logger.info("Terminating running Steamless process...")
+        try:
+            # On Windows the reader blocks in os.read(); closing stdout is what
+            # unblocks it. POSIX readers were woken through the wakeup pipe.
+            if self.is_windows and process.stdout:
+                try:
+                    process.stdout.close()
+                except Exception:
+                    pass
+                # Also close stderr if it's separate
+                if hasattr(process, "stderr") and process.stderr:
                     try:
-                        process.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        # Force kill if it doesn't terminate
-                        try:
-                            process.kill()
-                        except Exception:
-                            pass
-                        try:
-                            process.wait(timeout=1)
-                        except subprocess.TimeoutExpired:
-                            logger.error(
-                                "Failed to kill Steamless process even with SIGKILL"
-                            )
-                    logger.info("Steamless process terminated")
-                except Exception as e:
-                    logger.error(f"Error terminating Steamless process: {e}")
-                finally:
-                    self._current_process = None
-            else:
-                # Process already finished or doesn't exist
-                self._current_process = None
-        finally:
-            self._process_mutex.unlock()
+                        process.stderr.close()
+                    except Exception:
+                        pass
+
+            # Now terminate the process
+            process.terminate()
+            # Give it a moment to terminate gracefully
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                # Force kill if it doesn't terminate
+                try:
+                    process.kill()
+                except Exception:
+                    pass
+                try:
+                    process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    logger.error("Failed to kill Steamless process even with SIGKILL")
+            logger.info("Steamless process terminated")
+        except Exception as e:
+            logger.error(f"Error terminating Steamless process: {e}")
 
     def _convert_to_windows_path(self, linux_path: str) -> Optional[str]:
         """Convert Linux path to Windows path format for Wine."""
@@ -1732,7 +2108,15 @@ class SteamlessIntegration(QObject):
                 logger.debug("Running on Windows - no path conversion needed")
                 return linux_path
 
-            # Try winepath with timeout (Proton or Wine)
+            # Wine maps / to Z: in every prefix, so an absolute path converts
+            # without starting winepath (a full Wine process)
+            if linux_path.startswith("/"):
+                # Convert /home/user/path/file.exe to Z:\home\user\path\file.exe
+                windows_path = "Z:" + linux_path.replace("/", "\\")
+                logger.debug(f"Converted path: {linux_path} -> {windows_path}")
+                return windows_path
+
+            # Relative path: let winepath resolve it (Proton or Wine)
             if self.wine_command:
                 # Using Proton or Wine
                 wine_bin_dir = Path(self.wine_command).parent
@@ -1763,26 +2147,17 @@ class SteamlessIntegration(QObject):
                     return windows_path
                 else:
                     logger.warning(
-                        f"winepath failed with exit code {result.returncode}, using manual conversion"
+                        f"winepath failed with exit code {result.returncode}"
                     )
             except FileNotFoundError:
-                logger.warning(f"winepath not found, using manual conversion")
+                logger.warning("winepath not found")
             except subprocess.TimeoutExpired:
-                logger.warning(
-                    f"winepath timed out after 3 seconds, using manual conversion"
-                )
+                logger.warning("winepath timed out after 3 seconds")
             except Exception as e:
-                logger.warning(f"Error running winepath: {e}, using manual conversion")
+                logger.warning(f"Error running winepath: {e}")
 
-            # Fallback: Manual path conversion
-            if linux_path.startswith("/"):
-                # Convert /home/user/path/file.exe to Z:\home\user\path\file.exe
-                windows_path = "Z:" + linux_path.replace("/", "\\")
-                logger.info(f"Converted path (manual): {linux_path} -> {windows_path}")
-                return windows_path
-            else:
-                logger.error(f"Path is not absolute: {linux_path}")
-                return None
+            logger.error(f"Path is not absolute: {linux_path}")
+            return None
 
         except Exception as e:
             logger.error(
@@ -1798,19 +2173,17 @@ class SteamlessIntegration(QObject):
             original_backup = f"{original_exe}.original.exe"
 
             if os.path.exists(unpacked_exe):
-                if os.path.exists(original_backup):
-                    logger.warning(f"Backup file already exists: {original_backup}")
-                    os.remove(original_backup)
-
-                # Perform atomic renames with rollback
+                # Perform atomic renames with rollback. All three files share a
+                # directory, so os.replace is a single rename(2) and overwrites
+                # any stale backup left from an earlier run
                 try:
-                    shutil.move(original_exe, original_backup)
+                    os.replace(original_exe, original_backup)
                     self.progress.emit(
                         f"Renamed original: {os.path.basename(original_exe)} -> {os.path.basename(original_backup)}"
                     )
 
                     try:
-                        shutil.move(unpacked_exe, original_exe)
+                        os.replace(unpacked_exe, original_exe)
                         self.progress.emit(
                             f"Renamed unpacked: {os.path.basename(unpacked_exe)} -> {os.path.basename(original_exe)}"
                         )
@@ -1819,7 +2192,7 @@ class SteamlessIntegration(QObject):
                             f"Failed to rename unpacked file, rolling back: {e2}"
                         )
                         try:
-                            shutil.move(original_backup, original_exe)
+                            os.replace(original_backup, original_exe)
                             logger.info("Rollback successful")
                         except Exception as e3:
                             logger.critical(f"Rollback failed: {e3}")
@@ -1852,19 +2225,38 @@ class SteamlessIntegration(QObject):
             return False
 
 
-class SteamlessTask(QThread):
-    """Task for removing Steam DRM using Steamless"""
+class SteamlessTaskSignals(QObject):
+    """Signals emitted by SteamlessTask (a QRunnable cannot define its own)"""
 
     progress = pyqtSignal(str)
     progress_percentage = pyqtSignal(int)
     completed = pyqtSignal()
     error = pyqtSignal(tuple)  # Emits (Exception, message, traceback) like TaskRunner
     result = pyqtSignal(bool)
+    finished = pyqtSignal()  # Emitted once run() has returned
+
+
+class SteamlessTask(QRunnable):
+    """Task for removing Steam DRM using Steamless, run on the global QThreadPool"""
 
     def __init__(self):
         super().__init__()
+        # The TaskManager keeps the reference and stop() may wait on us after
+        # run() returns, so the pool must not delete the C++ object
+        self.setAutoDelete(False)
+
+        # Signals live on a QObject created here, on the caller's thread
+        self.signals = SteamlessTaskSignals()
+        self.progress = self.signals.progress
+        self.progress_percentage = self.signals.progress_percentage
+        self.completed = self.signals.completed
+        self.error = self.signals.error
+        self.result = self.signals.result
+        self.finished = self.signals.finished
+
         self._is_running = True
         self._thread_completed = False  # Track thread completion state
+        self._done = threading.Event()  # Set once run() has returned
         self._game_directory = None
 
         # Steamless configuration
@@ -1941,11 +2333,20 @@ class SteamlessTask(QThread):
         return True
 
     def set_game_directory(self, game_directory: str):
-        """Set the game directory to process (called before start())"""
+        """Set the game directory to process (called before queuing the task)"""
         self._game_directory = game_directory
 
     def run(self):
-        """Run Steamless on the game directory (QThread main loop)"""
+        """Run Steamless on the game directory (thread pool worker)"""
+        try:
+            if self._is_running:
+                self._run()
+        finally:
+            self._done.set()
+            self.finished.emit()
+
+    def _run(self):
+        """Body of run(); result/completed are emitted on every path"""
         try:
             success = False  # Default to failure
 
@@ -1982,22 +2383,22 @@ class SteamlessTask(QThread):
                     return
 
                 # Create SteamlessIntegration instance (created fresh for each run)
+                # stop() may clear self.steamless_integration at any time, so
+                # this thread keeps working through its own reference
+                integration = SteamlessIntegration(
+                    steamless_path=str(self.steamless_path),
+                    preferred_proton_version=self.proton_version,
+                )
+                # Connect signals - SteamlessIntegration uses different signal types
+                # NOTE: We connect signals but they should be delivered synchronously since
+                # process_game_with_steamless() is called from within the same thread
+                integration.progress.connect(self._handle_progress)
+                integration.error.connect(self._handle_integration_error)
+                integration.finished.connect(self._handle_integration_finished)
+
                 self._integration_mutex.lock()
                 try:
-                    self.steamless_integration = SteamlessIntegration(
-                        steamless_path=str(self.steamless_path),
-                        preferred_proton_version=self.proton_version,
-                    )
-                    # Connect signals - SteamlessIntegration uses different signal types
-                    # NOTE: We connect signals but they should be delivered synchronously since
-                    # process_game_with_steamless() is called from within the same thread
-                    self.steamless_integration.progress.connect(self._handle_progress)
-                    self.steamless_integration.error.connect(
-                        self._handle_integration_error
-                    )
-                    self.steamless_integration.finished.connect(
-                        self._handle_integration_finished
-                    )
+                    self.steamless_integration = integration
                 finally:
                     self._integration_mutex.unlock()
 
@@ -2005,26 +2406,22 @@ class SteamlessTask(QThread):
                 logger.info(
                     f"Processing game directory with Steamless: {self._game_directory}"
                 )
-                success = self.steamless_integration.process_game_with_steamless(
+                success = integration.process_game_with_steamless(
                     self._game_directory
                 )
 
                 # Store result for emission
                 final_success = success
 
-                # Emit result and completion signals BEFORE thread exit
-                # This ensures signals are delivered while the thread is still alive
-                if self.isRunning():
-                    self.result.emit(final_success)
-                    self.completed.emit()
+                # Emit result and completion signals before finished
+                self.result.emit(final_success)
+                self.completed.emit()
                 self._thread_completed = True
 
             except Exception as e:
                 error_msg = f"Unexpected error during Steamless processing: {e}"
                 self.progress.emit(error_msg)
                 logger.error(error_msg, exc_info=True)
-                import traceback
-
                 self.error.emit((type(e), str(e), traceback.format_exc()))
                 self.result.emit(success)
                 self.completed.emit()
@@ -2035,7 +2432,6 @@ class SteamlessTask(QThread):
             # Catch any exception that might crash the thread on startup
             error_msg = f"CRITICAL: Thread crashed on startup: {e}"
             logger.critical(error_msg, exc_info=True)
-            import traceback
 
             # Try to emit error even if thread is crashing
             try:
@@ -2047,11 +2443,9 @@ class SteamlessTask(QThread):
 
     def _handle_progress(self, message):
         """Handle progress messages from Steamless integration"""
-        # Check if thread is still running before emitting
-        if not self.isRunning() or not self._is_running:
-            logger.debug(
-                f"Ignoring progress message after thread exit: {message[:50]}..."
-            )
+        # Check if the task was stopped before emitting
+        if not self._is_running:
+            logger.debug(f"Ignoring progress message after stop: {message[:50]}...")
             return
 
         # Emit progress message
@@ -2059,9 +2453,9 @@ class SteamlessTask(QThread):
 
     def _handle_integration_error(self, message):
         """Handle error messages from SteamlessIntegration"""
-        # Check if thread is still running before emitting
-        if not self.isRunning() or not self._is_running:
-            logger.debug(f"Ignoring error message after thread exit: {message[:50]}...")
+        # Check if the task was stopped before emitting
+        if not self._is_running:
+            logger.debug(f"Ignoring error message after stop: {message[:50]}...")
             return
         logger.error(f"Steamless error: {message}")
         # Forward to UI - error will be emitted in run() as well
@@ -2069,9 +2463,9 @@ class SteamlessTask(QThread):
 
     def _handle_integration_finished(self, success):
         """Handle completion signal from SteamlessIntegration"""
-        # Check if thread is still running before emitting
-        if not self.isRunning() or not self._is_running:
-            logger.debug(f"Ignoring finished callback after thread exit")
+        # Check if the task was stopped before emitting
+        if not self._is_running:
+            logger.debug("Ignoring finished callback after stop")
             return
         if success:
             self.progress.emit("Steamless processing completed successfully")
@@ -2081,18 +2475,18 @@ class SteamlessTask(QThread):
 
     def _handle_error(self, message):
         """Legacy handler for errors - kept for compatibility"""
-        # Check if thread is still running before emitting
-        if not self.isRunning() or not self._is_running:
-            logger.debug(f"Ignoring error message after thread exit: {message[:50]}...")
+        # Check if the task was stopped before emitting
+        if not self._is_running:
+            logger.debug(f"Ignoring error message after stop: {message[:50]}...")
             return
         # This should not be used anymore since error signal now emits tuples
         logger.error(f"Steamless task error: {message}")
 
     def _handle_finished(self, success):
         """Legacy handler for completion - kept for compatibility"""
-        # Check if thread is still running before emitting
-        if not self.isRunning() or not self._is_running:
-            logger.debug(f"Ignoring finished callback after thread exit")
+        # Check if the task was stopped before emitting
+        if not self._is_running:
+            logger.debug("Ignoring finished callback after stop")
             return
         if success:
             self.progress.emit("Steamless processing completed successfully")
@@ -2109,61 +2503,56 @@ class SteamlessTask(QThread):
 
         self._is_running = False
 
-        # Terminate any running Steamless subprocess (thread-safe)
+        # Take ownership of the integration in a single critical section;
+        # everything below works on the local reference outside the lock
         self._integration_mutex.lock()
         try:
-            if self.steamless_integration:
-                try:
-                    self.steamless_integration.terminate_process()
-                except Exception as e:
-                    logger.error(f"Error during process termination: {e}")
+            integration = self.steamless_integration
+            self.steamless_integration = None
         finally:
             self._integration_mutex.unlock()
 
-        # Disconnect SteamlessIntegration signals if connected (thread-safe)
-        self._integration_mutex.lock()
-        try:
-            if self.steamless_integration:
-                try:
-                    # Disconnect all signals
-                    self.steamless_integration.progress.disconnect(
-                        self._handle_progress
-                    )
-                    self.steamless_integration.error.disconnect(
-                        self._handle_integration_error
-                    )
-                    self.steamless_integration.finished.disconnect(
-                        self._handle_integration_finished
-                    )
-                    logger.debug("SteamlessIntegration signals disconnected")
-                except (TypeError, RuntimeError) as e:
-                    # TypeError: signal not connected, RuntimeError: C++ object deleted
-                    logger.debug(f"Signal disconnect during stop (expected): {e}")
-        except Exception as e:
-            logger.error(f"Error during signal cleanup: {e}")
-        finally:
-            self._integration_mutex.unlock()
+        if integration:
+            # Terminate any running Steamless subprocess
+            try:
+                integration.terminate_process()
+            except Exception as e:
+                logger.error(f"Error during process termination: {e}")
 
-        # Wait for thread to finish BEFORE cleaning up
+            # Disconnect SteamlessIntegration signals if connected
+            try:
+                integration.progress.disconnect(self._handle_progress)
+                integration.error.disconnect(self._handle_integration_error)
+                integration.finished.disconnect(self._handle_integration_finished)
+                logger.debug("SteamlessIntegration signals disconnected")
+            except (TypeError, RuntimeError) as e:
+                # TypeError: signal not connected, RuntimeError: C++ object deleted
+                logger.debug(f"Signal disconnect during stop (expected): {e}")
+
+        # Wait for run() to finish BEFORE cleaning up
         # This prevents QObject deletion crashes
-        if self.isRunning():
-            logger.debug("Waiting for SteamlessTask thread to finish...")
-            self.quit()  # Ask thread to exit its event loop
-            if not self.wait(
-                600000
-            ):  # Wait up to 10 minutes (first-time .NET install can take 10-20 minutes)
-                logger.warning("SteamlessTask thread did not finish within timeout")
-                # Force terminate if needed (rare)
-                self.terminate()
-                self.wait(5000)  # Wait another 5 seconds
-        logger.debug("SteamlessTask thread has finished")
-
-        # Clean up references
-        self._integration_mutex.lock()
-        try:
-            self.steamless_integration = None
-        finally:
-            self._integration_mutex.unlock()
+        if QThreadPool.globalInstance().tryTake(self):
+            # Still queued and never started - nothing to wait for
+            self._done.set()
+            self.finished.emit()
+        elif not self._done.is_set():
+            logger.debug("Waiting for SteamlessTask to finish...")
+            # Wait up to 10 minutes (first-time .NET install can take 10-20 minutes)
+            # in short slices so progress is logged while the wait drags on
+            start = time.monotonic()
+            deadline = start + 600
+            next_report = start + 10
+            while not self._done.wait(0.2):
+                now = time.monotonic()
+                if now >= deadline:
+                    logger.warning("SteamlessTask did not finish within timeout")
+                    break
+                if now >= next_report:
+                    logger.debug(
+                        f"Still waiting for SteamlessTask ({now - start:.0f}s elapsed)..."
+                    )
+                    next_report = now + 10
+        logger.debug("SteamlessTask has finished")
 
         # Legacy compatibility
         self.process = None
@@ -1,3 +1,4 @@
+import functools
 import multiprocessing
 import os
 import sys
@@ -31,68 +32,60 @@ except ImportError:
     pass
 
 
-def update_appearance(app, accent="#C06C84", background="#000000", font=None):
-    """Apply a dynamic palette and custom font to the application"""
-    app.setStyle("Fusion")
-    dark_palette = QPalette()
-
-    background_color = QColor(background)
-    accent_color = QColor(accent)
-
-    dark_palette.setColor(QPalette.ColorRole.Window, background_color)
-    dark_palette.setColor(QPalette.ColorRole.WindowText, accent_color)
-    dark_palette.setColor(QPalette.ColorRole.Base, background_color.darker(120))
-    dark_palette.setColor(QPalette.ColorRole.AlternateBase, background_color)
-    dark_palette.setColor(QPalette.ColorRole.ToolTipBase, accent_color)
-    dark_palette.setColor(QPalette.ColorRole.ToolTipText, background_color)
-    dark_palette.setColor(QPalette.ColorRole.Text, accent_color)
-    dark_palette.setColor(QPalette.ColorRole.Button, background_color)
-    dark_palette.setColor(QPalette.ColorRole.ButtonText, accent_color)
-    dark_palette.setColor(QPalette.ColorRole.BrightText, accent_color.lighter(120))
-    dark_palette.setColor(QPalette.ColorRole.Link, accent_color.lighter(120))
-    dark_palette.setColor(QPalette.ColorRole.Highlight, accent_color)
-    dark_palette.setColor(QPalette.ColorRole.HighlightedText, background_color)
-    dark_palette.setColor(QPalette.ColorRole.PlaceholderText, accent_color.darker(120))
-
-    app.setPalette(dark_palette)
-
+@functools.lru_cache(maxsize=16)
+def _build_stylesheet(accent_hex, background_hex):
+    """Build the application stylesheet for an accent/background pair"""
     hover_lightness = 120
     selected_lightness = 150
     checked_lightness = 200
     doubled_lightness = 250
+
+    background_color = QColor(background_hex)
+    accent_color = QColor(accent_hex)
     background_color_effect = background_color
     if background_color_effect == QColor("#000000"):
         background_color_effect = QColor("#282828")
 
+    # Resolve every derived color to its hex name once
+    bg = background_color.name()
+    accent = accent_color.name()
+    bg_darker = background_color.darker(120).name()
+    bg_lighter = background_color.lighter(120).name()
+    accent_lighter = accent_color.lighter(120).name()
+    bg_hover = background_color_effect.lighter(hover_lightness).name()
+    bg_selected = background_color_effect.lighter(selected_lightness).name()
+    bg_checked = background_color_effect.lighter(checked_lightness).name()
+    bg_doubled = background_color_effect.lighter(doubled_lightness).name()
+
     gradient_border = f"""
-            border-top: 2px solid {accent_color.lighter(120).name()};
-            border-bottom: 2px solid {accent_color.lighter(120).name()};
-            border-left: 2px solid qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {accent_color.lighter(120).name()}, stop:0.5 {background_color.lighter(120).name()}, stop:1 {accent_color.lighter(120).name()});
-            border-right: 2px solid qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {accent_color.lighter(120).name()}, stop:0.5 {background_color.lighter(120).name()}, stop:1 {accent_color.lighter(120).name()});
+            border-top: 2px solid {accent_lighter};
+            border-bottom: 2px solid {accent_lighter};
+            border-left: 2px solid qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {accent_lighter}, stop:0.5 {bg_lighter}, stop:1 {accent_lighter});
+            border-right: 2px solid qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {accent_lighter}, stop:0.5 {bg_lighter}, stop:1 {accent_lighter});
     """
     gradient_border_full = f"""
-            border-top: 2px solid {accent_color.lighter(120).name()};
-            border-bottom: 2px solid {accent_color.lighter(120).name()};
-            border-left: 2px solid {accent_color.lighter(120).name()};
-            border-right: 2px solid {accent_color.lighter(120).name()};
+            border-top: 2px solid {accent_lighter};
+            border-bottom: 2px solid {accent_lighter};
+            border-left: 2px solid {accent_lighter};
+            border-right: 2px solid {accent_lighter};
     """
 
-    app.setStyleSheet(f"""
+    return f"""
         QLineEdit {{
-            background-color: {background_color.name()};
-            color: {accent_color.name()};
-            border: 1px solid {accent_color.name()};
+            background-color: {bg};
+            color: {accent};
+            border: 1px solid {accent};
             padding: 8px;
         }}
 
         QLineEdit:hover {{
-            background-color: {background_color.name()};
-            color: {accent_color.name()};
+            background-color: {bg};
+            color: {accent};
         }}
 
         QCheckBox {{
-            background-color: {background_color.name()};
-            color: {accent_color.name()};
+            background-color: {bg};
+            color: {accent};
             padding: 8px;
             spacing: 8px;
         }}
@@ -100,12 +93,12 @@ def update_appearance(app, accent="#C06C84", background="#000000", font=None):
         QCheckBox::indicator {{
             width: 12px;
             height: 12px;
-            background: {background_color.name()};
+            background: {bg};
             {gradient_border}
         }}
 
         QCheckBox::indicator:checked {{
-            background: {accent_color.name()};
+            background: {accent};
         }}
 
         QCheckBox::indicator:hover {{
@@ -113,13 +106,13 @@ def update_appearance(app, accent="#C06C84", background="#000000", font=None):
         }}
 
         QDialog {{
-            background-color: {background_color.name()};
-            color: {accent_color.name()};
+            background-color: {bg};
+            color: {accent};
         }}
 
         QListWidget {{
-            background-color: {background_color.darker(120).name()};
-            color: {accent_color.name()};
+            background-color: {bg_darker};
+            color: {accent};
             border-radius: 4px;
             /* VVV REMOVES THE WEIRD LITTLE TEXT BORDER/BACKGROUND IN DEPOT SELECTION VVV */
             outline: 0;
@@ -127,31 +120,31 @@ def update_appearance(app, accent="#C06C84", background="#000000", font=None):
         }}
 
         QListWidget::item {{
-            background-color: {background_color.darker(120).name()};
-            color: {accent_color.name()};
+            background-color: {bg_darker};
+            color: {accent};
             border-radius: 4px;
             padding: 6px;
         }}
 
         QListWidget::item:hover {{
-            background-color: {background_color_effect.lighter(hover_lightness).name()};
-            color: {accent_color.name()};
+            background-color: {bg_hover};
+            color: {accent};
         }}
 
         QListWidget::item:selected {{
-            background-color: {background_color_effect.lighter(selected_lightness).name()};
-            color: {accent_color.name()};
+            background-color: {bg_selected};
+            color: {accent};
         }}
 
         QListWidget::item:checked {{
-            background-color: {background_color_effect.lighter(checked_lightness).name()};
-            color: {accent_color.name()};
+            background-color: {bg_checked};
+            color: {accent};
             font-weight: bold;
         }}
 
         QListWidget::item:checked:selected {{
-            background-color: {background_color_effect.lighter(doubled_lightness).name()};
-            color: {accent_color.name()};
+            background-color: {bg_doubled};
+            color: {accent};
         }}
 
         QListWidget::indicator {{
@@ -160,11 +153,11 @@ def update_appearance(app, accent="#C06C84", background="#000000", font=None):
         }}
 
         QListWidget::indicator:unchecked {{
-            background-color: {background_color.name()};
+            background-color: {bg};
         }}
 
         QListWidget::indicator:checked {{
-            background-color: {accent_color.name()};
+            background-color: {accent};
         }}
 
         QListWidget::indicator:hover {{
@@ -172,29 +165,60 @@ def update_appearance(app, accent="#C06C84", background="#000000", font=None):
         }}
 
         QPushButton {{
-            background-color: {background_color.name()};
-            color: {accent_color.name()};
+            background-color: {bg};
+            color: {accent};
             padding: 6px 6px;
             {gradient_border}
             font-weight: bold;
         }}
 
         QPushButton:hover {{
-            background-color: {accent_color.name()};
-            color: {background_color.name()};
+            background-color: {accent};
+            color: {bg};
             {gradient_border_full}
         }}
 
         QLabel {{
-            color: {accent_color.name()};
+            color: {accent};
         }}
 
         QToolTip {{
-            background-color: {background_color.name()};
-            color: {accent_color.name()};
+            background-color: {bg};
+            color: {accent};
             padding: 6px;
         }}
-    """)
+    """
+
+
+def update_appearance(app, accent="#C06C84", background="#000000", font=None):
+    """Apply a dynamic palette and custom font to the application"""
+    app.setStyle("Fusion")
+    dark_palette = QPalette()
+
+    background_color = QColor(background)
+    accent_color = QColor(accent)
+    background_darker = background_color.darker(120)
+    accent_lighter = accent_color.lighter(120)
+    accent_darker = accent_color.darker(120)
+
+    dark_palette.setColor(QPalette.ColorRole.Window, background_color)
+    dark_palette.setColor(QPalette.ColorRole.WindowText, accent_color)
+    dark_palette.setColor(QPalette.ColorRole.Base, background_darker)
+    dark_palette.setColor(QPalette.ColorRole.AlternateBase, background_color)
+    dark_palette.setColor(QPalette.ColorRole.ToolTipBase, accent_color)
+    dark_palette.setColor(QPalette.ColorRole.ToolTipText, background_color)
+    dark_palette.setColor(QPalette.ColorRole.Text, accent_color)
+    dark_palette.setColor(QPalette.ColorRole.Button, background_color)
+    dark_palette.setColor(QPalette.ColorRole.ButtonText, accent_color)
+    dark_palette.setColor(QPalette.ColorRole.BrightText, accent_lighter)
+    dark_palette.setColor(QPalette.ColorRole.Link, accent_lighter)
+    dark_palette.setColor(QPalette.ColorRole.Highlight, accent_color)
+    dark_palette.setColor(QPalette.ColorRole.HighlightedText, background_color)
+    dark_palette.setColor(QPalette.ColorRole.PlaceholderText, accent_darker)
+
+    app.setPalette(dark_palette)
+
+    app.setStyleSheet(_build_stylesheet(accent, background))
 
     # Load & apply custom font
     font_path = resource_path("res/TrixieCyrG-Plain Regular.otf")
@@ -220,14 +244,12 @@ def main():
     version_file = resource_path("res/version")
     version = "unknown version"
 
-    if Path(version_file).is_file():
-        try:
-            with open(version_file, "r", encoding="utf-8") as f:
-                version = f.read().strip() or "unknown version"
-        except Exception as e:
-            logger.warning(f"Failed to read version file: {e}")
-    else:
+    try:
+        version = Path(version_file).read_text(encoding="utf-8").strip() or version
+    except FileNotFoundError:
         logger.warning("Version file not found, using unknown version")
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Failed to read version file: {e}")
 
     logger.info("========================================")
     logger.info(f"ACCELA {version} starting...")
@@ -239,15 +261,16 @@ def main():
 
     # Parse command-line arguments for ZIP files
     command_line_zips = []
-    for arg in sys.argv[1:]:  # Skip script name
-        if arg.lower().endswith('.zip'):
-            # Normalize path to handle relative paths correctly
-            zip_path = os.path.abspath(arg)
-            if os.path.exists(zip_path):
-                command_line_zips.append(zip_path)
-                logger.info(f"Found ZIP file from command line: {zip_path}")
-            else:
-                logger.warning(f"ZIP file not found: {arg}")
+    zip_args = (arg for arg in sys.argv[1:] if arg.casefold().endswith(".zip"))
+    for arg in zip_args:
+        # Normalize path to handle relative paths correctly
+        zip_path = os.path.abspath(arg)
+        # isfile() also rejects directories that happen to end in .zip
+        if os.path.isfile(zip_path):
+            command_line_zips.append(zip_path)
+            logger.info(f"Found ZIP file from command line: {zip_path}")
+        else:
+            logger.warning(f"ZIP file not found: {arg}")
 
     if command_line_zips:
         logger.info(f"Will process {len(command_line_zips)} ZIP file(s) from command line after initialization")
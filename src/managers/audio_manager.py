@@ -2,6 +2,8 @@ import os
 import logging
 import pygame
 import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 
 from utils.helpers import resource_path
@@ -9,6 +11,9 @@ from utils.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Arguments for pygame.mixer.init, applied when audio is first needed
+MIXER_INIT_KWARGS = {"frequency": 44100, "size": -16, "channels": 2, "buffer": 512}
+
 
 class AudioManager:
     def __init__(self, main_window):
@@ -16,13 +21,49 @@ class AudioManager:
         self.settings = get_settings()
         self.exit_sound_played = False
 
+        # Resolve the sound file locations once
+        self._sound_paths = {
+            "open": resource_path("res/etw.wav"),
+            "close": resource_path("res/lall.wav"),
+            "loop": resource_path("res/50hz.wav"),
+        }
+
+        # Cached copies of the saved audio settings
+        self.reload_settings()
+
         # Store current preview values
-        self.preview_master_volume = self.settings.value("master_volume", 80, type=int)
-        self.preview_effects_volume = self.settings.value("effects_volume", 50, type=int)
-        self.preview_hum_volume = self.settings.value("hum_volume", 20, type=int)
+        self.preview_master_volume = self._cfg_master_volume
+        self.preview_effects_volume = self._cfg_effects_volume
+        self.preview_hum_volume = self._cfg_hum_volume
+
+        # Coalesces slider preview updates into one set_volume per frame
+        self._preview_timer = QTimer()
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._flush_preview)
+
+        # Audio channels and sounds are created once the mixer is initialized
+        self._initialized = False
+        self.effects_channel = self.music_channel = self.hum_channel = None
+        self.open_sound = self.close_sound = self.loop_sound = None
+
+        # Opening the audio device is wasted work when every sound is disabled
+        if self._any_sound_enabled():
+            self._ensure_init()
+        else:
+            logger.debug("All sounds disabled, deferring audio initialization")
+
+    def _any_sound_enabled(self):
+        """Check whether any sound is enabled in the cached settings"""
+        return self._cfg_play_etw or self._cfg_play_lall or self._cfg_play_hum
+
+    def _ensure_init(self):
+        """Initialize the pygame mixer and load sounds on first use"""
+        if self._initialized:
+            return
+        self._initialized = True
 
         # Initialize pygame mixer
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        pygame.mixer.init(**MIXER_INIT_KWARGS)
 
         # Audio channels
         self.effects_channel = pygame.mixer.Channel(0)
@@ -31,6 +72,15 @@ class AudioManager:
 
         self.setup_sounds()
 
+    def reload_settings(self):
+        """Re-read the saved audio settings into the cached attributes"""
+        self._cfg_master_volume = self.settings.value("master_volume", 80, type=int)
+        self._cfg_effects_volume = self.settings.value("effects_volume", 50, type=int)
+        self._cfg_hum_volume = self.settings.value("hum_volume", 20, type=int)
+        self._cfg_play_etw = self.settings.value("play_etw", True, type=bool)
+        self._cfg_play_lall = self.settings.value("play_lall", True, type=bool)
+        self._cfg_play_hum = self.settings.value("play_50hz_hum", True, type=bool)
+
     def check_audio_devices(self):
         """Check available audio output devices"""
         if not pygame.mixer.get_init():
@@ -41,35 +91,38 @@ class AudioManager:
         return True
 
     def validate_audio_files(self):
-        """Validate that audio files exist and are accessible"""
+        """Validate audio files, mapping each sound name to whether its file is usable"""
         logger.debug("Validating audio files...")
-        audio_files = [
-            resource_path("res/etw.wav"),
-            resource_path("res/lall.wav"),
-            resource_path("res/50hz.wav")
-        ]
-
-        all_files_valid = True
-        for file_path in audio_files:
-            if not os.path.exists(file_path):
+        valid_files = {}
+        for name, file_path in self._sound_paths.items():
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 logger.error(f"Audio file not found: {file_path}")
-                all_files_valid = False
-            elif os.path.getsize(file_path) == 0:
+                valid_files[name] = False
+                continue
+
+            if file_size == 0:
                 logger.error(f"Audio file is empty: {file_path}")
-                all_files_valid = False
+                valid_files[name] = False
             else:
                 logger.debug(f"Audio file OK: {file_path}")
+                valid_files[name] = True
 
-        return all_files_valid
+        return valid_files
 
     def applyVolume(self, volumeSliderValue):
         """Convert slider value to linear volume"""
         linear_volume = volumeSliderValue / 100.0
-        logger.debug(f"Converting volume: {volumeSliderValue} -> {linear_volume:.3f}")
+        logger.debug("Converting volume: %s -> %.3f", volumeSliderValue, linear_volume)
         return linear_volume
 
     def setup_sounds(self):
         """Setup all audio effects with volume control using PyGame"""
+        if not self._initialized:
+            logger.debug("Audio not initialized yet, skipping sound setup")
+            return
+
         logger.debug("Setting up audio sounds...")
 
         # Check for audio devices first
@@ -78,72 +131,96 @@ class AudioManager:
             self.open_sound = self.close_sound = self.loop_sound = None
             return
 
-        # Validate audio files
-        if not self.validate_audio_files():
+        # Validate audio files; only the usable ones are loaded below
+        valid_files = self.validate_audio_files()
+        if not all(valid_files.values()):
             logger.warning("Some audio files are missing or invalid")
 
         try:
-            # Open sound ("Entering The Wired")
+            # Decode all sounds in parallel; playback is started from this thread
+            sounds = self._load_sounds({
+                name: path
+                for name, path in self._sound_paths.items()
+                if valid_files[name]
+            })
+
+            # Open sound ("Entering The Wired"), played by play_startup_sounds
             logger.debug("Setting up open sound...")
-            open_sound_path = resource_path("res/etw.wav")
-            if os.path.exists(open_sound_path):
-                logger.debug(f"Loading open sound: {open_sound_path}")
-                self.open_sound = pygame.mixer.Sound(open_sound_path)
-                if self.settings.value("play_etw", True, type=bool) and not self.effects_channel.get_busy():
-                    logger.debug("Playing open sound (ETW)")
-                    self.effects_channel.play(self.open_sound)
-            else:
-                logger.warning(f"Could not find open sound: {open_sound_path}")
-                self.open_sound = None
+            self.open_sound = sounds.get("open")
 
             # Close sound ("Let's All Love Lain")
             logger.debug("Setting up close sound...")
-            close_sound_path = resource_path("res/lall.wav")
-            if os.path.exists(close_sound_path):
-                logger.debug(f"Loading close sound: {close_sound_path}")
-                self.close_sound = pygame.mixer.Sound(close_sound_path)
+            self.close_sound = sounds.get("close")
+            if self.close_sound:
                 QApplication.instance().aboutToQuit.connect(self.on_app_about_to_quit)
-            else:
-                logger.warning(f"Could not find close sound: {close_sound_path}")
-                self.close_sound = None
 
             # Loop sound (50Hz hum)
             logger.debug("Setting up loop sound...")
-            loop_sound_path = resource_path("res/50hz.wav")
-            if os.path.exists(loop_sound_path):
-                logger.debug(f"Loading loop sound: {loop_sound_path}")
-                self.loop_sound = pygame.mixer.Sound(loop_sound_path)
-
-                # Only play if enabled in settings
-                if self.settings.value("play_50hz_hum", True, type=bool) and not self.hum_channel.get_busy():
-                    logger.debug("Starting loop sound playback")
-                    self.hum_channel.set_volume(0.0)
-                    self.hum_channel.play(self.loop_sound, loops=-1)
-            else:
-                logger.warning(f"Could not find loop sound: {loop_sound_path}")
-                self.loop_sound = None
-
-            # Apply initial audio settings
-            logger.debug("Applying initial audio settings...")
-            self.apply_audio_settings()
+            self.loop_sound = sounds.get("loop")
             logger.debug("Audio setup completed successfully")
 
         except Exception as e:
             logger.error(f"Error during audio setup: {e}")
             self.open_sound = self.close_sound = self.loop_sound = None
 
+    def play_startup_sounds(self):
+        """Apply the saved settings and play the startup sound; called once at startup"""
+        if not self._initialized:
+            logger.debug("Audio not initialized, skipping startup sounds")
+            return
+
+        # Apply initial audio settings (this also starts the hum if enabled)
+        logger.debug("Applying initial audio settings...")
+        self.apply_audio_settings()
+
+        if self.open_sound and self._cfg_play_etw and not self.effects_channel.get_busy():
+            logger.debug("Playing open sound (ETW)")
+            self.effects_channel.play(self.open_sound)
+
+    def _load_sounds(self, sound_paths):
+        """Load sound files concurrently, mapping each name to a Sound or None"""
+        if not sound_paths:
+            return {}
+
+        def load(name, path):
+            logger.debug(f"Loading {name} sound: {path}")
+            try:
+                return pygame.mixer.Sound(path)
+            except FileNotFoundError:
+                logger.warning(f"Could not find {name} sound: {path}")
+                return None
+            except Exception as e:
+                logger.error(f"Failed to load {name} sound: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=len(sound_paths)) as executor:
+            futures = {
+                name: executor.submit(load, name, path)
+                for name, path in sound_paths.items()
+            }
+        return {name: future.result() for name, future in futures.items()}
+
     def apply_audio_settings(self):
         """Applies all audio settings including volumes using saved settings"""
+        if not self._initialized:
+            # Sounds may have just been enabled; load them before applying
+            if not self._any_sound_enabled():
+                return
+            self._ensure_init()
+
         if not any([self.open_sound, self.close_sound, self.loop_sound]):
             logger.debug("Audio not available, skipping settings application")
             return
 
         logger.debug("Applying audio settings...")
 
-        # Get slider values from settings
-        master_volume = self.applyVolume(self.settings.value("master_volume", 80, type=int))
-        effects_volume = self.applyVolume(self.settings.value("effects_volume", 50, type=int))
-        hum_volume = self.applyVolume(self.settings.value("hum_volume", 20, type=int))
+        # Saved settings take precedence over any pending preview update
+        self._preview_timer.stop()
+
+        # Get slider values from the cached settings
+        master_volume = self.applyVolume(self._cfg_master_volume)
+        effects_volume = self.applyVolume(self._cfg_effects_volume)
+        hum_volume = self.applyVolume(self._cfg_hum_volume)
 
         logger.debug(f"Volume levels - Master: {master_volume:.3f}, Effects: {effects_volume:.3f}, Hum: {hum_volume:.3f}")
 
@@ -155,7 +232,7 @@ class AudioManager:
         logger.debug(f"Hum volume: {master_volume * hum_volume:.3f}")
 
         # Handle loop sound playback state
-        play_loop = self.settings.value("play_50hz_hum", True, type=bool)
+        play_loop = self._cfg_play_hum
         if play_loop and not self.hum_channel.get_busy() and self.loop_sound:
             logger.debug("Starting loop sound playback")
             self.hum_channel.play(self.loop_sound, loops=-1)
@@ -165,6 +242,8 @@ class AudioManager:
 
     def apply_preview_volumes(self, master=None, effects=None, hum=None):
         """Apply preview volumes using current slider values"""
+        self._ensure_init()
+
         # Update preview values if provided
         if master is not None:
             self.preview_master_volume = master
@@ -173,12 +252,22 @@ class AudioManager:
         if hum is not None:
             self.preview_hum_volume = hum
 
+        # Restarting the timer keeps only the latest values of a drag
+        self._preview_timer.start(16)
+
+    def _flush_preview(self):
+        """Push the latest preview volumes to the audio channels"""
         # Calculate volumes using current preview values
         master_volume = self.applyVolume(self.preview_master_volume)
         effects_volume = self.applyVolume(self.preview_effects_volume)
         hum_volume = self.applyVolume(self.preview_hum_volume)
 
-        logger.debug(f"Preview volumes - Master: {self.preview_master_volume}, Effects: {self.preview_effects_volume}, Hum: {self.preview_hum_volume}")
+        logger.debug(
+            "Preview volumes - Master: %s, Effects: %s, Hum: %s",
+            self.preview_master_volume,
+            self.preview_effects_volume,
+            self.preview_hum_volume,
+        )
 
         # Apply to channels
         self.effects_channel.set_volume(master_volume * effects_volume)
@@ -186,17 +275,17 @@ class AudioManager:
 
     def apply_master_volume_preview(self, value):
         """Apply master volume changes for preview only"""
-        logger.debug(f"Preview master volume: {value}")
+        logger.debug("Preview master volume: %s", value)
         self.apply_preview_volumes(master=value)
 
     def apply_effects_volume_preview(self, value):
         """Apply effects volume changes for preview only"""
-        logger.debug(f"Preview effects volume: {value}")
+        logger.debug("Preview effects volume: %s", value)
         self.apply_preview_volumes(effects=value)
 
     def apply_hum_volume_preview(self, value):
         """Apply hum volume changes for preview only"""
-        logger.debug(f"Preview hum volume: {value}")
+        logger.debug("Preview hum volume: %s", value)
         self.apply_preview_volumes(hum=value)
 
     def on_app_about_to_quit(self):
@@ -219,25 +308,20 @@ class AudioManager:
 
     def play_close_sound_and_wait(self):
         """Play the close sound and wait with timeout protection"""
-        if (self.close_sound and self.settings.value("play_lall", True, type=bool)):
+        if self.close_sound and self._cfg_play_lall:
             logger.debug("Starting close sound playback with blocking wait")
 
             # Play the sound
             self.effects_channel.play(self.close_sound)
 
-            # Get sound length for timeout calculation
-            sound_length = self.close_sound.get_length()
-            max_wait_time = sound_length + 2.0  # Add 2 second buffer
-            start_time = time.time()
-
-            # Wait with timeout protection
-            while self.effects_channel.get_busy():
-                # Check for timeout (in case sound gets stuck)
-                if time.time() - start_time > max_wait_time:
-                    logger.warning("Sound playback timeout, continuing anyway")
-                    break
+            # Block once for the length of the sound plus a small margin
+            # instead of polling the channel until it goes idle
+            time.sleep(self.close_sound.get_length() + 0.1)
 
-                time.sleep(0.05)
+            # Timeout protection in case the sound gets stuck
+            if self.effects_channel.get_busy():
+                logger.warning("Sound playback timeout, continuing anyway")
+                self.effects_channel.stop()
 
             logger.debug("Close sound finished, continuing shutdown")
         else:
@@ -246,6 +330,7 @@ class AudioManager:
     def test_etw_sound(self):
         """Test play the ETW sound"""
         logger.debug("Testing ETW sound")
+        self._ensure_init()
         if self.open_sound:
             # If already playing, stop and restart from beginning
             if self.effects_channel.get_busy():
@@ -258,6 +343,7 @@ class AudioManager:
     def test_lall_sound(self):
         """Test play the LALL sound"""
         logger.debug("Testing LALL sound")
+        self._ensure_init()
         if self.close_sound:
             # If already playing, stop and restart from beginning
             if self.effects_channel.get_busy():
@@ -269,13 +355,19 @@ class AudioManager:
 
     def audio_diagnostics(self):
         """Run audio system diagnostics"""
+        # Everything below only produces debug output
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
         logger.debug("=== Audio Diagnostics ===")
 
-        if pygame.mixer.get_init():
+        mixer_init = pygame.mixer.get_init()
+        if mixer_init:
+            frequency, audio_format, channel_count = mixer_init
             logger.debug("Pygame mixer initialized")
-            logger.debug(f"Frequency: {pygame.mixer.get_init()[0]}")
-            logger.debug(f"Format: {pygame.mixer.get_init()[1]}")
-            logger.debug(f"Channels: {pygame.mixer.get_init()[2]}")
+            logger.debug(f"Frequency: {frequency}")
+            logger.debug(f"Format: {audio_format}")
+            logger.debug(f"Channels: {channel_count}")
         else:
             logger.debug("Pygame mixer not initialized")
 
@@ -19,6 +19,9 @@ logger = logging.getLogger(__name__)
 # 14 Days in seconds (14 * 24 * 60 * 60)
 EXPIRATION_SECONDS = 1_209_600 
 
+# meta table key holding the Zstd dictionary the DB builder trained for depots_json
+ZSTD_DICT_META_KEY = "zstd_dict"
+
 class DatabaseManager:
     _instance = None
     _lock = threading.Lock()
@@ -39,8 +42,17 @@ class DatabaseManager:
         
         self.db_path = self._setup_database_path()
         self.conn = self._connect_db()
-        self.cctx = zstd.ZstdCompressor(level=3) if zstd else None
-        self.dctx = zstd.ZstdDecompressor() if zstd else None
+        self.cctx = None
+        self.dctx = None
+        if zstd:
+            zdict = self._load_zstd_dictionary()
+            if zdict:
+                # Dictionary-backed contexts still handle rows compressed without one
+                self.cctx = zstd.ZstdCompressor(level=3, dict_data=zdict)
+                self.dctx = zstd.ZstdDecompressor(dict_data=zdict)
+            else:
+                self.cctx = zstd.ZstdCompressor(level=3)
+                self.dctx = zstd.ZstdDecompressor()
         
         self._initialized = True
         logger.info(f"DatabaseManager initialized at: {self.db_path}")
@@ -83,6 +95,19 @@ class DatabaseManager:
             logger.error(f"DB Connection failed: {e}")
             return None
 
+    def _load_zstd_dictionary(self):
+        """Load the depots_json Zstd dictionary, if the DB was built with one"""
+        if not self.conn:
+            return None
+        try:
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (ZSTD_DICT_META_KEY,)
+            ).fetchone()
+        except sqlite3.Error:
+            # Older databases have no meta table
+            return None
+        return zstd.ZstdCompressionDict(row['value']) if row else None
+
     def _create_empty_db(self, path):
         try:
             conn = sqlite3.connect(str(path))
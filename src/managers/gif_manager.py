@@ -1,3 +1,4 @@
+import atexit
 import os
 import logging
 from pathlib import Path
@@ -5,15 +6,57 @@ from PIL import Image
 import numpy as np
 import time
 import concurrent.futures
-from functools import partial
+from functools import lru_cache, partial
 import shutil
+import subprocess
+import sys
 import hashlib
 import json
+import mmap
 
 from utils.helpers import get_base_path, resource_path
 
 logger = logging.getLogger(__name__)
 
+# Indices into (v, t, p, q) giving the (r, g, b) sources for each hue segment
+HSV_SEGMENT_CHANNELS = np.array([
+    [0, 1, 2],    # hi == 0: (v, t, p)
+    [3, 0, 2],    # hi == 1: (q, v, p)
+    [2, 0, 1],    # hi == 2: (p, v, t)
+    [2, 3, 0],    # hi == 3: (p, q, v)
+    [1, 2, 0],    # hi == 4: (t, p, v)
+    [0, 2, 3],    # hi == 5: (v, p, q)
+], dtype=np.intp)
+
+# Optimize saved GIFs (with gifsicle -O2 if available, else Pillow's optimizer)
+OPTIMIZE_GIFS = True
+
+# Source GIF path -> ((mtime_ns, size), sha256 hex digest)
+_gif_hash_cache = {}
+
+# Worker threads shared by every process_gif_batch call, created on first use
+_executor = None
+
+def _get_executor():
+    """Return the shared GIF worker pool, creating it on first use"""
+    global _executor
+    if _executor is None:
+        # Pillow and NumPy release the GIL for the heavy lifting, so threads
+        # avoid the process spawn and pickling cost for every GIF
+        cpu_count = os.cpu_count() or 4
+        max_workers = min(cpu_count * 2, 14) # Cap at 14, I like even numbers :)
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gif"
+        )
+        atexit.register(_shutdown_executor)
+        logger.info(f"Processing GIFs with up to {max_workers} workers")
+    return _executor
+
+def _shutdown_executor():
+    """Stop the shared GIF worker pool without waiting on queued work"""
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+
 def process_gif_batch(output_dir, accent_color):
     """
     Process all GIFs from multiple input directories in parallel
@@ -29,37 +72,42 @@ def process_gif_batch(output_dir, accent_color):
         resource_path("res/gif")
     ]
 
-    gif_list = _find_unique_gifs(input_dirs)
+    gif_sources = _find_unique_gifs(input_dirs)
 
-    if not gif_list:
+    if not gif_sources:
         logger.warning("No GIF files found in any input directory")
         return
 
-    logger.info(f"Found {len(gif_list)} unique GIFs across {len(input_dirs)} directories")
+    logger.info(f"Found {len(gif_sources)} unique GIFs across {len(input_dirs)} directories")
 
     # Create color-specific subdirectory
     color_subdir = os.path.join(output_dir, accent_color.lstrip('#'))
     os.makedirs(color_subdir, exist_ok=True)
 
-    regeneration_needed = _check_regeneration(gif_list, input_dirs, color_subdir, accent_color)
+    # Hash every source GIF once; the regeneration check and workers share these
+    source_hashes = _calculate_source_hashes(gif_sources)
+
+    regeneration_needed = _check_regeneration(gif_sources, color_subdir, source_hashes)
 
     if not regeneration_needed:
         logger.info("All GIFs are up to date, updating symlinks only.")
-        _update_color_symlinks(gif_list, accent_color, color_subdir, output_dir)
+        _update_color_symlinks(gif_sources, accent_color, color_subdir, output_dir)
         return
 
-    logger.info(f"Colorizing {len(gif_list)} GIFs with color: {accent_color}")
+    logger.info(f"Colorizing {len(gif_sources)} GIFs with color: {accent_color}")
     start_time = time.time()
 
-    completed_count = _process_gifs(gif_list, input_dirs, color_subdir, accent_color)
+    completed_count, new_hashes = _process_gifs(
+        gif_sources, color_subdir, accent_color, source_hashes
+    )
 
     total_time = time.time() - start_time
-    logger.info(f"Completed processing {completed_count}/{len(gif_list)} GIFs in {total_time:.2f}s "
+    logger.info(f"Completed processing {completed_count}/{len(gif_sources)} GIFs in {total_time:.2f}s "
                 f"({total_time/max(completed_count,1):.2f}s per GIF)")
 
-    _write_hashes_file(color_subdir)
+    _write_hashes_file(color_subdir, new_hashes)
 
-    _update_color_symlinks(gif_list, accent_color, color_subdir, output_dir)
+    _update_color_symlinks(gif_sources, accent_color, color_subdir, output_dir)
 
 def _cleanup_old_files(output_dir):
     """Remove hex.txt and non-standard colorized files"""
@@ -83,25 +131,38 @@ def _cleanup_old_files(output_dir):
 def _find_unique_gifs(input_dirs):
     """
     Find all unique GIF files across input directories.
-    Returns the first occurrence of each GIF filename found in the directories.
+    Returns a dict of GIF filename -> source path, keeping the first
+    occurrence of each filename found in the directories.
     """
     gif_files = {}
 
     for input_dir in input_dirs:
-        if not os.path.exists(input_dir):
+        try:
+            entries = os.scandir(input_dir)
+        except FileNotFoundError:
             logger.warning(f"Input directory does not exist: {input_dir}")
             continue
 
         logger.debug(f"Scanning directory: {input_dir}")
-        for filename in os.listdir(input_dir):
-            if filename.lower().endswith('.gif'):
-                if filename not in gif_files:
-                    gif_files[filename] = input_dir
-                    logger.debug(f"Found GIF: {filename} in {input_dir}")
+        with entries:
+            for entry in entries:
+                if entry.name in gif_files or not entry.name.lower().endswith('.gif'):
+                    continue
+                if entry.is_file():
+                    gif_files[entry.name] = entry.path
+                    logger.debug(f"Found GIF: {entry.name} in {input_dir}")
 
-    return list(gif_files.keys())
+    return gif_files
 
-def _check_regeneration(gif_list, input_dirs, color_subdir, accent_color):
+def _calculate_source_hashes(gif_sources):
+    """
+    Hash all source GIFs in parallel
+    Returns a dict of GIF name -> SHA256 hash (None if hashing failed)
+    """
+    hashes = _get_executor().map(_calculate_gif_hash, gif_sources.values())
+    return dict(zip(gif_sources, hashes))
+
+def _check_regeneration(gif_sources, color_subdir, source_hashes):
     """
     Check if any GIFs need regeneration by comparing hashes
     Returns True if any GIF needs regeneration
@@ -112,98 +173,89 @@ def _check_regeneration(gif_list, input_dirs, color_subdir, accent_color):
     existing_hashes = _load_hashes(color_subdir)
     needs_regeneration = False
 
-    for gif_name in gif_list:
-        source_dir = _find_gif_source(input_dirs, gif_name)
-        if not source_dir:
-            continue
-
-        input_path = os.path.join(source_dir, gif_name)
+    for gif_name, input_path in gif_sources.items():
         output_path = os.path.join(color_subdir, gif_name)
 
         # Check if regeneration is needed
-        if _should_regenerate_gif(input_path, output_path, gif_name, existing_hashes):
+        if _should_regenerate_gif(input_path, output_path, gif_name, existing_hashes,
+                                  source_hashes.get(gif_name)):
             needs_regeneration = True
             # We can break early if we find at least one that needs regeneration
             break
 
     return needs_regeneration
 
-def _process_gifs(gif_list, input_dirs, color_subdir, accent_color):
+def _process_gifs(gif_sources, color_subdir, accent_color, source_hashes):
     """
     Process GIFs in parallel batches
+    Returns (completed count, dict of GIF name -> source hash to record)
     """
-    cpu_count = os.cpu_count() or 4
-    max_workers = min(cpu_count, len(gif_list), 14) # Cap at 14, I like even numbers :)
-
-    logger.info(f"Processing with {max_workers} workers")
+    existing_hashes = _load_hashes(color_subdir)
 
     # Prepare batch data
-    batch_data = []
-    for gif_name in gif_list:
-        source_dir = _find_gif_source(input_dirs, gif_name)
-        if source_dir:
-            batch_data.append({
-                'name': gif_name,
-                'source_path': os.path.join(source_dir, gif_name),
-                'output_path': os.path.join(color_subdir, gif_name),
-                'accent_color': accent_color
-            })
+    batch_data = [
+        {
+            'name': gif_name,
+            'source_path': source_path,
+            'output_path': os.path.join(color_subdir, gif_name),
+            'accent_color': accent_color,
+            'source_hash': source_hashes.get(gif_name),
+            'existing_hash': existing_hashes.get(gif_name)
+        }
+        for gif_name, source_path in gif_sources.items()
+    ]
 
     # Process in parallel
     completed_count = 0
-    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-        future_to_gif = {
-            executor.submit(_process_single_gif_worker, gif_data): gif_data
-            for gif_data in batch_data
-        }
+    new_hashes = {}
+    # The worker catches its own errors, so map() never raises here
+    results = _get_executor().map(_process_single_gif_worker, batch_data)
 
-        for future in concurrent.futures.as_completed(future_to_gif):
-            gif_data = future_to_gif[future]
-            try:
-                result = future.result()
-                if result:
-                    completed_count += 1
-                    if completed_count % 10 == 0:
-                        logger.info(f"Progress: {completed_count}/{len(batch_data)} GIFs processed")
-            except Exception as e:
-                logger.error(f"Error processing {gif_data['name']}: {e}")
+    for gif_data, (success, stored_hash) in zip(batch_data, results):
+        if stored_hash:
+            new_hashes[gif_data['name']] = stored_hash
+        if success:
+            completed_count += 1
+            if completed_count % 10 == 0:
+                logger.info(f"Progress: {completed_count}/{len(batch_data)} GIFs processed")
 
-    return completed_count
+    return completed_count, new_hashes
 
 def _process_single_gif_worker(gif_data):
     """
-    Worker function for processing a single GIF in a separate process
+    Worker function for processing a single GIF on a pool thread
+    Returns (success, source hash to record or None)
     """
     try:
         return _process_single_gif(
             gif_data['source_path'],
             gif_data['output_path'],
             gif_data['accent_color'],
-            gif_data['name']
+            gif_data['source_hash'],
+            gif_data['existing_hash']
         )
     except Exception as e:
         logger.error(f"Worker error for {gif_data['name']}: {e}")
-        return False
+        return False, None
 
-def _process_single_gif(input_path, output_path, accent_color, gif_name):
+def _process_single_gif(input_path, output_path, accent_color, source_hash, existing_hash):
     """
     Process a single GIF with hash-based caching
+    Returns (success, source hash to record or None)
     """
     # Check if we need to regenerate
-    if os.path.exists(output_path):
-        source_hash = _calculate_gif_hash(input_path)
-        existing_hash = _get_stored_hash(gif_name, os.path.dirname(output_path))
-
-        if source_hash and existing_hash and source_hash == existing_hash:
-            logger.debug(f"Using cached: {os.path.basename(output_path)}")
-            return True
+    if source_hash and source_hash == existing_hash and os.path.exists(output_path):
+        logger.debug(f"Using cached: {os.path.basename(output_path)}")
+        return True, source_hash
 
     # Process the GIF
-    return _apply_color_to_gif(input_path, output_path, accent_color, gif_name)
+    return _apply_color_to_gif(input_path, output_path, accent_color, source_hash)
 
-def _apply_color_to_gif(input_path, output_path, accent_color, gif_name):
+def _apply_color_to_gif(input_path, output_path, accent_color, source_hash):
     """
     Apply color transformation to GIF
+    Returns (success, source hash to record or None). A fallback copy of the
+    original records no hash, so it is retried on the next run.
     """
     start_time = time.time()
 
@@ -213,34 +265,27 @@ def _apply_color_to_gif(input_path, output_path, accent_color, gif_name):
         target_h, target_s, target_v = _rgb_to_hsv(*target_rgb)
 
         with Image.open(input_path) as gif:
-            # Extract all frames
-            frames = []
-            frame_durations = []
+            # Decode every frame straight into one (N, H, W, 4) RGBA stack,
+            # so no per-frame RGBA images are kept alongside it
+            frame_count = getattr(gif, 'n_frames', 1)
+            width, height = gif.size
+            stack = np.empty((frame_count, height, width, 4), dtype=np.uint8)
+            frame_durations = [100] * frame_count
             original_info = gif.info.copy()
-            try:
-                while True:
-                    frame = gif.copy().convert('RGBA')
-                    frames.append(frame)
-                    frame_durations.append(gif.info.get('duration', 100))
-                    gif.seek(gif.tell() + 1)
-            except EOFError:
-                pass
+            for index in range(frame_count):
+                gif.seek(index)
+                stack[index] = np.asarray(gif.convert('RGBA'))
+                frame_durations[index] = gif.info.get('duration', 100)
 
-            if not frames:
-                return False
-
-            processed_frames = _process_frames(frames, target_h, target_s, target_v)
+            processed_frames = _process_frames(stack, target_h, target_s, target_v)
 
             _save_gif(processed_frames, frame_durations, original_info, output_path)
 
-            # Store hash for this GIF in temporary storage
-            _store_temp_hash(gif_name, input_path, os.path.dirname(output_path))
-
             elapsed = time.time() - start_time
             if elapsed > 0.5:
                 logger.debug(f"Colorized {os.path.basename(input_path)}: {elapsed:.3f}s")
 
-            return True
+            return True, source_hash
 
     except Exception as e:
         logger.error(f"Error processing {input_path}: {e}")
@@ -248,10 +293,10 @@ def _apply_color_to_gif(input_path, output_path, accent_color, gif_name):
         try:
             shutil.copy2(input_path, output_path)
             logger.info(f"Fallback copy created for: {os.path.basename(input_path)}")
-            return True
+            return True, None
         except Exception as copy_error:
             logger.error(f"Fallback copy also failed for {input_path}: {copy_error}")
-            return False
+            return False, None
 
 def _load_hashes(output_dir):
     """Load existing hashes from hashes.json"""
@@ -264,68 +309,43 @@ def _load_hashes(output_dir):
             logger.warning(f"Could not load hashes.json: {e}")
     return {}
 
-def _write_hashes_file(output_dir):
-    """Write hashes.json"""
+def _write_hashes_file(output_dir, hashes):
+    """Atomically write hashes.json"""
     hashes_path = os.path.join(output_dir, "hashes.json")
+    temp_path = f"{hashes_path}.tmp"
     try:
-        # Collect all temporary hashes
-        final_hashes = {}
-        for filename in os.listdir(output_dir):
-            if filename.endswith('.gif'):
-                gif_name = filename
-                hash_file = os.path.join(output_dir, f".{gif_name}.hash")
-                if os.path.exists(hash_file):
-                    try:
-                        with open(hash_file, 'r') as f:
-                            final_hashes[gif_name] = f.read().strip()
-                        # Clean up temp hash file
-                        os.remove(hash_file)
-                    except Exception as e:
-                        logger.warning(f"Could not read hash for {gif_name}: {e}")
-
-        # Write final hashes.json
-        with open(hashes_path, 'w') as f:
-            json.dump(final_hashes, f, indent=2)
-        logger.info(f"Saved {len(final_hashes)} hashes to {hashes_path}")
+        with open(temp_path, 'w') as f:
+            json.dump(hashes, f, indent=2)
+        os.replace(temp_path, hashes_path)
+        logger.info(f"Saved {len(hashes)} hashes to {hashes_path}")
 
     except Exception as e:
         logger.error(f"Could not write hashes.json: {e}")
 
-def _store_temp_hash(gif_name, input_path, output_dir):
-    """Store hash temporarily in individual files to avoid read/write conflicts"""
-    try:
-        source_hash = _calculate_gif_hash(input_path)
-        if source_hash:
-            hash_file = os.path.join(output_dir, f".{gif_name}.hash")
-            with open(hash_file, 'w') as f:
-                f.write(source_hash)
-    except Exception as e:
-        logger.warning(f"Could not store temp hash for {gif_name}: {e}")
-
-def _get_stored_hash(gif_name, output_dir):
-    """Get stored hash from temporary file"""
-    hash_file = os.path.join(output_dir, f".{gif_name}.hash")
-    if os.path.exists(hash_file):
-        try:
-            with open(hash_file, 'r') as f:
-                return f.read().strip()
-        except Exception:
-            pass
-    return None
-
 def _calculate_gif_hash(file_path):
-    """Calculate SHA256 hash of a GIF file"""
+    """Calculate SHA256 hash of a GIF file, reusing it while the file is unchanged"""
     try:
-        hasher = hashlib.sha256()
+        st = os.stat(file_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _gif_hash_cache.get(file_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            if st.st_size:
+                # Hand the whole mapped file to the hash in a single update
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    source_hash = hashlib.sha256(mapped).hexdigest()
+            else:
+                # Empty files cannot be mapped
+                source_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+        _gif_hash_cache[file_path] = (stamp, source_hash)
+        return source_hash
     except Exception as e:
         logger.error(f"Error calculating hash for {file_path}: {e}")
         return None
 
-def _should_regenerate_gif(input_path, output_path, gif_name, existing_hashes):
+def _should_regenerate_gif(input_path, output_path, gif_name, existing_hashes, current_hash):
     """Check if we need to regenerate the colorized GIF"""
     if not os.path.exists(output_path):
         return True
@@ -333,7 +353,6 @@ def _should_regenerate_gif(input_path, output_path, gif_name, existing_hashes):
     if not os.path.exists(input_path):
         return False
 
-    current_hash = _calculate_gif_hash(input_path)
     if not current_hash:
         return True
 
@@ -343,126 +362,108 @@ def _should_regenerate_gif(input_path, output_path, gif_name, existing_hashes):
 
     return False
 
-def _process_frames(frames, target_h, target_s, target_v):
-    """Process all frames with color transformation"""
-    processed_frames = []
+def _process_frames(stack, target_h, target_s, target_v):
+    """Recolor an (N, H, W, 4) RGBA stack in place and wrap each frame as an image"""
+    _apply_color_transform(stack, target_h, target_s, target_v)
 
-    for frame in frames:
-        img_array = np.array(frame, dtype=np.float32)
-        processed_array = _apply_color_transform(img_array, target_h, target_s, target_v)
-        processed_frames.append(Image.fromarray(processed_array.astype(np.uint8), 'RGBA'))
-
-    return processed_frames
+    # frombuffer borrows each frame's bytes from the stack rather than copying
+    height, width = stack.shape[1:3]
+    return [
+        Image.frombuffer('RGBA', (width, height), frame_array, 'raw', 'RGBA', 0, 1)
+        for frame_array in stack
+    ]
 
-def _apply_color_transform(img_array, target_h, target_s, target_v):
-    """Apply color transformation to image array"""
-    # Extract channels
-    r, g, b, a = img_array[..., 0], img_array[..., 1], img_array[..., 2], img_array[..., 3]
+def _apply_color_transform(stack, target_h, target_s, target_v):
+    """
+    Apply color transformation in place to an (N, H, W, 4) uint8 stack of
+    RGBA frames. Saturation and value are averaged per frame.
+    """
+    rgb = stack[..., :3]
+    a = stack[..., 3]
 
-    # Calculate colorfulness (std dev) for each pixel
-    rgb_mean = (r + g + b) / 3.0
-    rgb_std = np.sqrt(((r - rgb_mean)**2 + (g - rgb_mean)**2 + (b - rgb_mean)**2) / 3.0)
+    # Calculate colorfulness as the channel spread (max - min), in uint8
+    mx = rgb.max(axis=-1)
+    df = rgb.min(axis=-1)
+    np.subtract(mx, df, out=df)
 
-    # Create mask for colored pixels
-    colored_mask = (a > 10) & (rgb_std > 5)
+    # Create mask for colored pixels (a spread above 11 roughly matches the
+    # previous per-pixel std dev > 5 threshold)
+    colored_mask = (a > 10) & (df > 11)
 
     if not np.any(colored_mask):
-        return img_array  # No colored pixels to process
-
-    # Extract colored pixels
-    colored_pixels = img_array[colored_mask]
-    colored_rgb = colored_pixels[:, :3]
-
-    # Convert colored RGB to HSV
-    colored_hsv = _rgb_to_hsv_batch(colored_rgb)
-
-    # Calculate average saturation and value
-    avg_s = np.mean(colored_hsv[:, 1])
-    avg_v = np.mean(colored_hsv[:, 2])
-
-    # Avoid division by zero
-    avg_s = max(avg_s, 0.001)
-    avg_v = max(avg_v, 0.001)
-
-    # Apply transformations
-    new_h = np.full(colored_hsv.shape[0], target_h)
-    new_s = np.clip(colored_hsv[:, 1] * (target_s / avg_s), 0.0, 1.0)
-    new_v = np.clip(colored_hsv[:, 2] * (target_v / avg_v), 0.0, 1.0)
-
-    # Convert back to RGB
-    new_rgb = _hsv_to_rgb_batch(new_h, new_s, new_v)
-
-    # Update the colored pixels
-    result_array = img_array.copy()
-    result_array[colored_mask, :3] = new_rgb
-
-    return result_array
-
-def _rgb_to_hsv_batch(rgb_array):
-    """Convert RGB to HSV for batch of pixels"""
-    r, g, b = rgb_array[..., 0], rgb_array[..., 1], rgb_array[..., 2]
-    r, g, b = r/255.0, g/255.0, b/255.0
-
-    mx = np.maximum(np.maximum(r, g), b)
-    mn = np.minimum(np.minimum(r, g), b)
-    df = mx - mn
-
-    h = np.zeros_like(mx)
-    s = np.zeros_like(mx)
-    v = mx
+        return  # No colored pixels to process
+
+    # The original hue is replaced outright, so only saturation and value
+    # are needed, kept on the 8-bit HSV scale (S and V in 0-255). Colored
+    # pixels are never gray, so their max is non-zero.
+    colored_v = mx[colored_mask]
+    colored_max = colored_v.astype(np.uint16)
+    colored_s = df[colored_mask].astype(np.uint16)
+    colored_s *= 255
+    colored_s += colored_max >> 1
+    colored_s //= colored_max
+    colored_s = colored_s.astype(np.uint8)
+
+    # Masked pixels come out frame by frame, so each frame with colored
+    # pixels owns one contiguous segment of the colored arrays
+    counts = np.count_nonzero(colored_mask, axis=(1, 2))
+    frame_pixels = counts[counts > 0]
+    segment_ends = np.cumsum(frame_pixels)
+    segment_starts = segment_ends - frame_pixels
+
+    # Calculate average saturation and value per segment, as 0-1 fractions
+    level_totals = frame_pixels * 255.0
+    avg_s = np.add.reduceat(colored_s, segment_starts, dtype=np.uint64) / level_totals
+    avg_v = np.add.reduceat(colored_v, segment_starts, dtype=np.uint64) / level_totals
 
     # Avoid division by zero
-    df_nonzero = df != 0
-
-    # Calculate hue
-    mask_r = (mx == r) & df_nonzero
-    mask_g = (mx == g) & df_nonzero
-    mask_b = (mx == b) & df_nonzero
-
-    h[mask_r] = (60 * ((g[mask_r] - b[mask_r]) / df[mask_r]) + 360) % 360
-    h[mask_g] = (60 * ((b[mask_g] - r[mask_g]) / df[mask_g]) + 120) % 360
-    h[mask_b] = (60 * ((r[mask_b] - g[mask_b]) / df[mask_b]) + 240) % 360
-
-    # Calculate saturation
-    s[mx != 0] = df[mx != 0] / mx[mx != 0]
-
-    return np.stack([h, s, v], axis=-1)
+    np.maximum(avg_s, 0.001, out=avg_s)
+    np.maximum(avg_v, 0.001, out=avg_v)
+
+    # Apply transformations through per-segment lookup tables, so the
+    # per-pixel work stays in uint8
+    s_tables = _scaled_level_tables(target_s / avg_s)
+    v_tables = _scaled_level_tables(target_v / avg_v)
+    for s_table, v_table, start, end in zip(s_tables, v_tables, segment_starts, segment_ends):
+        colored_s[start:end] = s_table[colored_s[start:end]]
+        colored_v[start:end] = v_table[colored_v[start:end]]
+
+    # Convert back to RGB and update the colored pixels
+    rgb[colored_mask] = _hsv_to_rgb_batch(target_h, colored_s, colored_v)
+
+def _scaled_level_tables(gains):
+    """Build one uint8 table per gain mapping each 8-bit level to level * gain"""
+    tables = np.multiply.outer(gains, np.arange(256, dtype=np.float64))
+    np.rint(tables, out=tables)
+    np.clip(tables, 0, 255, out=tables)
+    return tables.astype(np.uint8)
 
 def _hsv_to_rgb_batch(h, s, v):
-    """Convert HSV to RGB for batch of pixels"""
-    h = h % 360
-    hi = (h / 60).astype(int) % 6
-    f = (h / 60) - (h / 60).astype(int)
-
-    p = v * (1 - s)
-    q = v * (1 - f * s)
-    t = v * (1 - (1 - f) * s)
-
-    # Initialize result arrays
-    r = np.zeros_like(h)
-    g = np.zeros_like(h)
-    b = np.zeros_like(h)
-
-    # Assign based on hue segment
-    masks = [hi == i for i in range(6)]
-    conditions = [
-        (v, t, p),    # hi == 0
-        (q, v, p),    # hi == 1
-        (p, v, t),    # hi == 2
-        (p, q, v),    # hi == 3
-        (t, p, v),    # hi == 4
-        (v, p, q)     # hi == 5
-    ]
-
-    for i, (rr, gg, bb) in enumerate(conditions):
-        mask = masks[i]
-        r[mask] = rr[mask]
-        g[mask] = gg[mask]
-        b[mask] = bb[mask]
-
-    # Scale to 0-255 and stack
-    rgb = np.stack([r * 255, g * 255, b * 255], axis=-1)
-    return np.clip(rgb, 0, 255).astype(np.float32)
+    """
+    Convert a single hue with per-pixel uint8 saturation and value arrays
+    (both 0-255) to an (N, 3) uint8 RGB array
+    """
+    h6 = (h % 360) / 60
+    hi = int(h6) % 6
+    f = h6 - int(h6)
+
+    # For a fixed hue every channel is v * (1 - k * s), with k = 0 for v,
+    # 1 - f for t, 1 for p and f for q. In fixed point that is
+    # v - (v * s / 255) * k / 256 with k scaled to 0-256, which keeps every
+    # intermediate within uint16.
+    desaturation = np.array([0.0, 1 - f, 1.0, f]) * 256
+    desaturation = np.rint(desaturation).astype(np.uint16)[HSV_SEGMENT_CHANNELS[hi]]
+    vs = v.astype(np.uint16)
+    vs *= s
+    vs += 127
+    vs //= 255
+    drop = np.multiply.outer(vs, desaturation)
+    drop += 128
+    drop >>= 8
+
+    # The drop never exceeds v, so the subtraction cannot wrap
+    rgb = drop.astype(np.uint8)
+    return np.subtract(v[:, np.newaxis], rgb, out=rgb)
 
 def _rgb_to_hsv(r, g, b):
     """Convert single RGB pixel to HSV"""
@@ -487,58 +488,104 @@ def _rgb_to_hsv(r, g, b):
     return (h, s, v)
 
 def _save_gif(frames, durations, gif_info, output_path):
-    """Save frames as GIF"""
-    if frames:
+    """Save frames as GIF, optimizing with gifsicle when it is installed"""
+    if not frames:
+        return
+
+    gifsicle_path = _find_gifsicle() if OPTIMIZE_GIFS else None
+    save_path = f"{output_path}.tmp" if gifsicle_path else output_path
+
+    try:
         frames[0].save(
-            output_path,
+            save_path,
+            format='GIF',
             save_all=True,
             append_images=frames[1:],
             duration=durations,
             loop=gif_info.get('loop', 0),
-            optimize=True,
+            # Skip Pillow's slow optimizer when gifsicle will optimize the result
+            optimize=OPTIMIZE_GIFS and not gifsicle_path,
             disposal=2
         )
 
-def _update_color_symlinks(gif_list, accent_color, color_subdir, output_dir):
+        if not gifsicle_path:
+            return
+
+        try:
+            subprocess.run(
+                [gifsicle_path, "-O2", "-o", output_path, save_path],
+                check=True,
+                capture_output=True,
+                creationflags=subprocess.CREATE_NO_WINDOW
+                if sys.platform == "win32"
+                else 0,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"gifsicle failed for {os.path.basename(output_path)}, keeping unoptimized GIF: {e}")
+            os.replace(save_path, output_path)
+    finally:
+        # Never leave the intermediate GIF behind, even if saving failed
+        if save_path != output_path:
+            _remove_if_present(save_path)
+
+@lru_cache(maxsize=None)
+def _find_gifsicle():
+    """Locate the gifsicle binary once per session"""
+    return shutil.which("gifsicle")
+
+def _update_color_symlinks(gif_names, accent_color, color_subdir, output_dir):
     """Update all symlinks to point to current colorized versions"""
     logger.info("Updating symlinks to current color...")
-    successful_links = 0
 
-    for gif_name in gif_list:
-        colorized_path = os.path.join(color_subdir, gif_name)
-        symlink_path = os.path.join(output_dir, gif_name)
+    # Each link is independent filesystem work, so swap them on the pool
+    results = _get_executor().map(
+        partial(_link_colorized_gif, color_subdir=color_subdir, output_dir=output_dir),
+        gif_names,
+    )
+    successful_links = sum(results)
+
+    logger.info(f"Symlink update complete: {successful_links}/{len(gif_names)} links created")
 
-        if os.path.exists(colorized_path):
-            if _create_color_symlink(colorized_path, symlink_path):
-                successful_links += 1
-        else:
-            logger.warning(f"Colorized file not found for {gif_name}")
+def _link_colorized_gif(gif_name, color_subdir, output_dir):
+    """Point one output GIF at its colorized version"""
+    colorized_path = os.path.join(color_subdir, gif_name)
+    symlink_path = os.path.join(output_dir, gif_name)
 
-    logger.info(f"Symlink update complete: {successful_links}/{len(gif_list)} links created")
+    if not os.path.exists(colorized_path):
+        logger.warning(f"Colorized file not found for {gif_name}")
+        return False
+    return _create_color_symlink(colorized_path, symlink_path)
 
 def _create_color_symlink(target_path, symlink_path):
-    """Create symlink pointing to colorized file"""
+    """
+    Create symlink pointing to colorized file.
+    The link is built under a temporary name and swapped in with os.replace,
+    so the output path always holds either the old or the new link.
+    """
+    temp_path = symlink_path + '.new'
     try:
-        if os.path.exists(symlink_path) or os.path.islink(symlink_path):
-            os.remove(symlink_path)
-
+        _remove_if_present(temp_path)
         # Create relative symlink
         target_rel = os.path.relpath(target_path, os.path.dirname(symlink_path))
-        os.symlink(target_rel, symlink_path)
+        os.symlink(target_rel, temp_path)
+        os.replace(temp_path, symlink_path)
         return True
     except Exception as e:
         logger.warning(f"Symlink failed for {os.path.basename(symlink_path)}: {e}")
         try:
-            shutil.copy2(target_path, symlink_path)
+            # Copy beside the destination and swap, so an old symlink is
+            # replaced rather than written through
+            _remove_if_present(temp_path)
+            shutil.copy2(target_path, temp_path)
+            os.replace(temp_path, symlink_path)
             return True
         except Exception as copy_error:
             logger.error(f"File copy also failed: {copy_error}")
             return False
 
-def _find_gif_source(input_dirs, gif_name):
-    """Find which input directory contains the GIF file"""
-    for input_dir in input_dirs:
-        potential_path = os.path.join(input_dir, gif_name)
-        if os.path.exists(potential_path):
-            return input_dir
-    return None
+def _remove_if_present(path):
+    """Remove a file or link, ignoring it if it does not exist"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
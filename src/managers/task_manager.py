@@ -6,7 +6,7 @@ import sys
 import tempfile
 from pathlib import Path
 
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QThreadPool, QTimer
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
 try:
@@ -678,7 +678,7 @@ class TaskManager:
         self.steamless_task.finished.connect(self._on_steamless_finished)
         self.steamless_task.error.connect(self._handle_steamless_task_error)
         self.steamless_task.set_game_directory(game_directory)
-        self.steamless_task.start()
+        QThreadPool.globalInstance().start(self.steamless_task)
 
     def _on_steamless_complete(self, success):
         """Handle Steamless processing completion"""
@@ -731,7 +731,7 @@ class TaskManager:
             QTimer.singleShot(0, self._clear_steamless_task)
 
         # Note: steamless_task_runner and steamless_worker are not used for SteamlessTask
-        # SteamlessTask is a QThread, not managed by TaskRunner
+        # SteamlessTask is a QRunnable on the global QThreadPool, not managed by TaskRunner
 
         # Continue to achievement generation even if Steamless failed
         achievements_enabled = self.settings.value("generate_achievements", False, type=bool)
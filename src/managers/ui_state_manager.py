@@ -25,6 +25,8 @@ class UIStateManager:
         self.random_gif_path = None
         self.download_movie = None
         self.main_movie = None
+        self._download_movies = {}  # Download GIF path -> QMovie, reused across switches
+        self._last_accent = None  # Accent color the colorized GIFs were built for
 
         # Queue UI elements
         self.queue_widget = None
@@ -49,16 +51,54 @@ class UIStateManager:
         self._update_gifs()
 
     def _update_gifs(self):
-        """Update GIFs with current accent color"""
+        """Update GIFs with current accent color, unless they already match it"""
+        accent_color = self.main_window.accent_color
+        if accent_color == self._last_accent:
+            return
+
         output_dir = str(get_base_path() / "gifs/colorized")
-        process_gif_batch(output_dir, self.main_window.accent_color)
+        process_gif_batch(output_dir, accent_color)
+        self._last_accent = accent_color
         self._reload_movies()
 
     def _reload_movies(self):
         """Reload movie objects with current GIFs"""
+        old_movies = [self.main_movie, *self._download_movies.values()]
+        current_path = self.current_movie.fileName() if self.current_movie else None
+
         main_gif_path = str(get_base_path() / "gifs/colorized/main.gif")
-        if os.path.exists(main_gif_path):
-            self.main_movie = QMovie(main_gif_path)
+        self.main_movie = self._create_movie(main_gif_path) if os.path.exists(main_gif_path) else None
+        self._download_movies = {
+            path: self._create_movie(path) for path in self.download_gifs if os.path.exists(path)
+        }
+
+        # Move the label onto the rebuilt movie for whatever GIF it was showing
+        if current_path:
+            if current_path == main_gif_path:
+                new_current = self.main_movie
+            else:
+                new_current = self._download_movies.get(current_path)
+                self.download_movie = new_current
+            if new_current and new_current.isValid():
+                self.main_window.drop_label.setMovie(new_current)
+                new_current.start()
+                self.current_movie = new_current
+            else:
+                # Detach the label before its movie is released below
+                self.main_window.drop_label.setMovie(None)
+                self.current_movie = None
+
+        for movie in old_movies:
+            if movie is not None:
+                movie.stop()
+                movie.deleteLater()
+
+    @staticmethod
+    def _create_movie(path):
+        """Create a QMovie that keeps its decoded frames after the first loop"""
+        movie = QMovie(path)
+        movie.setCacheMode(QMovie.CacheMode.CacheAll)
+        return movie
 
     def setup_initial_gif(self, drop_label):
         """Setup the initial GIF display"""
@@ -211,8 +251,11 @@ class UIStateManager:
         if self.current_movie:
             self.current_movie.stop()
 
-        self.random_gif_path = random.choice(self.download_gifs)
-        self.download_movie = QMovie(self.random_gif_path)
+        if not self._download_movies:
+            return
+
+        self.random_gif_path = random.choice(list(self._download_movies))
+        self.download_movie = self._download_movies[self.random_gif_path]
         if self.download_movie.isValid():
             self.current_movie = self.download_movie
             self.main_window.drop_label.setMovie(self.current_movie)
@@ -8,7 +8,8 @@ Fetches all Steam apps and builds a SQLite database of AppID -> App Details
 - Single DB writer thread
 - Reuses existing DB entries (skips already-fetched appids)
 - Graceful CTRL+C handling (clean shutdown)
-- Compresses depot JSON data with Zstandard to save space
+- Compresses depot JSON data with Zstandard to save space, using a dictionary
+  trained on the depot JSONs and stored in the 'meta' table
 - Stores the relative header path (e.g. '1004640/hash/header.jpg') in 'header_path'.
 """
 
@@ -21,8 +22,11 @@ import time
 import threading
 import queue
 import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Set, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # steam.client import (requires: pip install steam[client] gevent)
 try:
@@ -38,12 +42,21 @@ try:
 except ImportError:
     raise SystemExit("Missing dependency: pip install 'zstandard'")
 
+# orjson import (optional: pip install orjson) - serializes depot JSON much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("steam_hdr_builder")
 logger.setLevel(logging.INFO)
 ch = logging.StreamHandler()
 ch.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
 logger.addHandler(ch)
 
+# meta table key holding the trained Zstd dictionary for depots_json blobs
+ZSTD_DICT_META_KEY = "zstd_dict"
+
 def init_db(db_path: Path):
     conn = sqlite3.connect(str(db_path))
     cur = conn.cursor()
@@ -62,6 +75,15 @@ def init_db(db_path: Path):
         )
         """
     )
+    # Key/value store for DB-wide data (e.g. the depots_json Zstd dictionary)
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value BLOB
+        )
+        """
+    )
     conn.commit()
     conn.close()
 
@@ -78,36 +100,107 @@ def load_existing_appids(db_path: Path) -> Set[int]:
     return {row[0] for row in rows}
 
 class DBWriter(threading.Thread):
+    # Upper bounds on how much queued work a single commit may cover
+    MAX_BATCHES_PER_COMMIT = 32
+    MAX_ROWS_PER_COMMIT = 5000
+    # Depot JSONs share one small schema, so a dictionary trained on a
+    # sample of them compresses each tiny blob far better
+    DICT_SAMPLE_COUNT = 10000
+    DICT_SIZE = 16384
+
     def __init__(self, db_path: Path, result_queue: "queue.Queue[Dict[int, Dict]]", stop_event: threading.Event):
         super().__init__(daemon=True)
         self.db_path = db_path
         self.result_queue = result_queue
         self.stop_event = stop_event
-        # Initialize Zstd compressor once
-        self.cctx = zstd.ZstdCompressor(level=3) 
+        # Initialize Zstd compressor once; swapped for a dictionary-backed one
+        # once a dictionary is loaded or trained
+        self.cctx = zstd.ZstdCompressor(level=3)
+        self.dict_samples: Optional[List[bytes]] = []
+
+    def _load_dictionary(self, cur: sqlite3.Cursor):
+        """Reuse the DB's Zstd dictionary so old and new rows share it"""
+        cur.execute("SELECT value FROM meta WHERE key = ?", (ZSTD_DICT_META_KEY,))
+        row = cur.fetchone()
+        if row:
+            self._use_dictionary(zstd.ZstdCompressionDict(row[0]))
+            logger.info("Loaded existing Zstd dictionary (%d bytes)", len(row[0]))
+
+    def _use_dictionary(self, zdict):
+        self.cctx = zstd.ZstdCompressor(level=3, dict_data=zdict)
+        self.dict_samples = None
+
+    def _collect_dict_sample(self, cur: sqlite3.Cursor, depots_json: bytes):
+        """Gather depot JSON samples and train the dictionary once enough arrive"""
+        self.dict_samples.append(depots_json)
+        if len(self.dict_samples) < self.DICT_SAMPLE_COUNT:
+            return
+        try:
+            zdict = zstd.train_dictionary(self.DICT_SIZE, self.dict_samples)
+        except zstd.ZstdError as e:
+            logger.warning("Zstd dictionary training failed, compressing without one: %s", e)
+            self.dict_samples = None
+            return
+        dict_bytes = zdict.as_bytes()
+        cur.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (ZSTD_DICT_META_KEY, dict_bytes),
+        )
+        self._use_dictionary(zdict)
+        logger.info("Trained Zstd dictionary (%d bytes) from %d depot samples", len(dict_bytes), self.DICT_SAMPLE_COUNT)
 
     def run(self):
         # Set a long timeout for the DB connection
         conn = sqlite3.connect(str(self.db_path), timeout=30)
         cur = conn.cursor()
+        # WAL + NORMAL sync: commits append to the log instead of fsyncing
+        # the rollback journal and the DB file every time
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA cache_size=-65536")
+        self._load_dictionary(cur)
         logger.info("DB writer started")
         while not (self.stop_event.is_set() and self.result_queue.empty()):
             try:
-                batch = self.result_queue.get(timeout=0.5)
+                batches = [self.result_queue.get(timeout=0.5)]
             except queue.Empty:
                 continue
+
+            # Take whatever else is already queued so one commit covers it all
+            pending_rows = len(batches[0])
+            while len(batches) < self.MAX_BATCHES_PER_COMMIT and pending_rows < self.MAX_ROWS_PER_COMMIT:
+                try:
+                    batch = self.result_queue.get_nowait()
+                except queue.Empty:
+                    break
+                batches.append(batch)
+                pending_rows += len(batch)
+
+            for batch in batches:
+                try:
+                    self._write_batch(cur, batch)
+                except Exception as e:
+                    logger.exception("Error writing batch to DB: %s", e)
             try:
-                self._write_batch(cur, batch)
                 conn.commit()
             except Exception as e:
-                logger.exception("Error writing batch to DB: %s", e)
+                logger.exception("Error committing batches to DB: %s", e)
             finally:
-                self.result_queue.task_done()
+                for _ in batches:
+                    self.result_queue.task_done()
+        # Checkpoint and leave the DB as a single self-contained file, since
+        # it is shipped as the app's seed database
+        try:
+            cur.execute("PRAGMA journal_mode=DELETE")
+        except sqlite3.Error as e:
+            logger.warning("Could not switch DB back to rollback journal: %s", e)
         conn.close()
         logger.info("DB writer stopped and DB closed")
 
     def _write_batch(self, cur: sqlite3.Cursor, results: Dict[str, dict]):
         now = int(time.time())
+        rows = []
         for appid_str, data in results.items():
             try:
                 appid = int(appid_str)
@@ -151,24 +244,36 @@ class DBWriter(threading.Thread):
                 installdir = config.get("installdir")
                 
                 # Compress depots
-                depots_json_str = json.dumps(filtered_depots, ensure_ascii=False)
-                depots_compressed = self.cctx.compress(depots_json_str.encode('utf-8'))
+                depots_json = _serialize_depots(filtered_depots)
+                depots_compressed = self.cctx.compress(depots_json)
+                if self.dict_samples is not None:
+                    self._collect_dict_sample(cur, depots_json)
                 
                 # Optimization: Store relative path (e.g. "1004640/hash/header.jpg")
                 header_raw = _extract_header_fragment(common.get("header_image"))
                 header_path = _normalize_header_path(appid, header_raw)
                 
-                cur.execute(
-                    """
-                    INSERT OR REPLACE INTO apps
-                    (appid, name, header_path, installdir, depots_json, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (appid, name, header_path, installdir, depots_compressed, now),
-                )
+                rows.append((appid, name, header_path, installdir, depots_compressed, now))
             except Exception:
                 logger.exception("Failed to process appid %s", appid_str)
 
+        # One statement for the whole batch instead of one execute() per app
+        cur.executemany(
+            """
+            INSERT OR REPLACE INTO apps
+            (appid, name, header_path, installdir, depots_json, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+def _serialize_depots(filtered_depots: Dict) -> bytes:
+    """Serialize the filtered depot data to UTF-8 JSON bytes"""
+    if orjson:
+        # Depot IDs from steam.client may not be strings
+        return orjson.dumps(filtered_depots, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(filtered_depots, ensure_ascii=False).encode('utf-8')
+
 def _extract_header_fragment(header_entry) -> Optional[str]:
     if not header_entry:
         return None
@@ -240,8 +345,33 @@ def _construct_header_url(header_path: Optional[str]) -> Optional[str]:
     # Stored path: {appid}/{optional_hash}/header.jpg
     return f"https://shared.akamai.steamstatic.com/store_item_assets/steam/apps/{header_path}"
 
+class RateLimiter:
+    """
+    Token bucket (burst of one) shared by every thread hitting the Store API.
+    acquire() blocks until the caller's slot comes up.
+    """
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def acquire(self, stop_event: Optional[threading.Event] = None):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            if stop_event:
+                stop_event.wait(delay)
+            else:
+                time.sleep(delay)
+
 class SteamWorker(threading.Thread):
-    def __init__(self, worker_id: int, work_queue: "queue.Queue[List[int]]", result_queue: "queue.Queue[Dict[str, dict]]", stop_event: threading.Event, counter_ref: dict, api_key: Optional[str] = None, connect_timeout: int = 30):
+    # Concurrent Store API fallback requests per worker
+    FALLBACK_THREADS = 6
+
+    def __init__(self, worker_id: int, work_queue: "queue.Queue[List[int]]", result_queue: "queue.Queue[Dict[str, dict]]", stop_event: threading.Event, counter_ref: dict, rate_limiter: RateLimiter, api_key: Optional[str] = None, connect_timeout: int = 30):
         super().__init__(daemon=True)
         self.worker_id = worker_id
         self.work_queue = work_queue
@@ -251,6 +381,12 @@ class SteamWorker(threading.Thread):
         self.connect_timeout = connect_timeout
         self.client: Optional[SteamClient] = None
         self.counter_ref = counter_ref
+        self.rate_limiter = rate_limiter
+        # Keep-alive session so Web API fallbacks reuse pooled TLS connections
+        self.session = _create_session()
+        self.fallback_pool = ThreadPoolExecutor(
+            max_workers=self.FALLBACK_THREADS, thread_name_prefix=f"W{worker_id}-fallback"
+        )
 
     def run(self):
         # Try to initialize steam client
@@ -310,16 +446,16 @@ class SteamWorker(threading.Thread):
                 if self.client: 
                     logger.debug("[W%d] Fallback to Web API for %d apps", self.worker_id, len(failed_appids))
                 
+                # Overlap the requests; the shared rate limiter paces them
                 fallback_results = {}
-                for appid in failed_appids:
-                    if self.stop_event.is_set(): break
-                    
-                    fallback = _fetch_store_api_details(appid)
+                futures = {
+                    self.fallback_pool.submit(self._fetch_fallback, appid): appid
+                    for appid in failed_appids
+                }
+                for future in as_completed(futures):
+                    fallback = future.result()
                     if fallback:
-                        fallback_results[str(appid)] = fallback
-                        time.sleep(1.5) 
-                    else:
-                        time.sleep(0.5)
+                        fallback_results[str(futures[future])] = fallback
 
                 if fallback_results:
                     self.result_queue.put(fallback_results)
@@ -334,16 +470,42 @@ class SteamWorker(threading.Thread):
                 self.client.disconnect()
         except Exception:
             pass
+        self.fallback_pool.shutdown(wait=True)
+        self.session.close()
         logger.info("[W%d] stopped", self.worker_id)
 
-def _fetch_store_api_details(appid: int) -> Optional[Dict]:
+    def _fetch_fallback(self, appid: int) -> Optional[Dict]:
+        if self.stop_event.is_set():
+            return None
+        self.rate_limiter.acquire(self.stop_event)
+        if self.stop_event.is_set():
+            return None
+        return _fetch_store_api_details(self.session, appid)
+
+def _create_session() -> requests.Session:
+    """
+    Create a pooled keep-alive session that retries transient HTTP failures
+    (rate limiting and 5xx) with backoff.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand the last response back so callers keep their own status handling
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+def _fetch_store_api_details(session: requests.Session, appid: int) -> Optional[Dict]:
     """
     Fetch detailed info via the Steam Store API.
     """
     url = "https://store.steampowered.com/api/appdetails"
     params = {"appids": appid}
     try:
-        r = requests.get(url, params=params, timeout=10)
+        r = session.get(url, params=params, timeout=10)
         if not r.ok:
             return None
             
@@ -382,6 +544,7 @@ def get_all_app_ids_via_store_service(api_key: Optional[str]) -> Set[int]:
     last_appid = 0
     more_items = True
     batch_size = 50000 
+    session = _create_session()
     
     while more_items:
         params = {
@@ -397,7 +560,7 @@ def get_all_app_ids_via_store_service(api_key: Optional[str]) -> Set[int]:
             params["key"] = api_key
 
         try:
-            r = requests.get(url, params=params, timeout=30)
+            r = session.get(url, params=params, timeout=30)
             r.raise_for_status()
             data = r.json()
             
@@ -433,6 +596,7 @@ def get_all_app_ids_via_store_service(api_key: Optional[str]) -> Set[int]:
             logger.exception(f"Error fetching app list: {e}")
             break
 
+    session.close()
     return app_ids
 
 def chunk_list(lst: List[int], size: int) -> List[List[int]]:
@@ -460,7 +624,7 @@ class ProgressReporter(threading.Thread):
             logger.info(f"Progress: {done:,} / {self.total:,} ({pct:.2f}%) | Rate: {rate:.1f} apps/s | Elapsed: {format_duration(elapsed)}")
             time.sleep(5)
 
-def main(output_dir: Path, workers: int, batch_size: int, api_key: Optional[str] = None):
+def main(output_dir: Path, workers: int, batch_size: int, api_key: Optional[str] = None, store_rate: float = 2.0):
     output_dir.mkdir(parents=True, exist_ok=True)
     db_path = output_dir / "steam_headers.db"
 
@@ -496,9 +660,12 @@ def main(output_dir: Path, workers: int, batch_size: int, api_key: Optional[str]
     db_writer = DBWriter(db_path=db_path, result_queue=result_q, stop_event=stop_event)
     db_writer.start()
 
+    # One limiter across all workers keeps the Store API fallback under Steam's rate limit
+    store_rate_limiter = RateLimiter(store_rate)
+
     workers_list: List[SteamWorker] = []
     for i in range(workers):
-        w = SteamWorker(worker_id=i + 1, work_queue=work_q, result_queue=result_q, stop_event=stop_event, counter_ref=counter, api_key=api_key)
+        w = SteamWorker(worker_id=i + 1, work_queue=work_q, result_queue=result_q, stop_event=stop_event, counter_ref=counter, rate_limiter=store_rate_limiter, api_key=api_key)
         w.start()
         workers_list.append(w)
 
@@ -551,7 +718,8 @@ if __name__ == "__main__":
     parser.add_argument("--batch-size", "-b", type=int, default=50, help="Number of apps per batch")
     # Default key from oureveryday
     parser.add_argument("--api-key", type=str, default="1DD0450A99F573693CD031EBB160907D", help="Steam Web API key (REQUIRED for reliable app list generation)")
+    parser.add_argument("--store-rate", type=float, default=2.0, help="Max Store API fallback requests per second (shared by all workers)")
     args = parser.parse_args()
 
     outdir = Path(args.output_dir)
-    main(output_dir=outdir, workers=args.workers, batch_size=args.batch_size, api_key=args.api_key)
\ No newline at end of file
+    main(output_dir=outdir, workers=args.workers, batch_size=args.batch_size, api_key=args.api_key, store_rate=args.store_rate)
\ No newline at end of file
@@ -274,6 +274,7 @@ class AudioDialog(QDialog):
 
         # Apply final audio settings
         if hasattr(self.parent(), 'audio_manager'):
+            self.parent().audio_manager.reload_settings()
             self.parent().audio_manager.apply_audio_settings()
 
         logger.info("Audio settings saved.")
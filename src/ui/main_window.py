@@ -203,7 +203,7 @@ class MainWindow(QMainWindow):
 
     def _setup_audio(self):
         """Setup audio effects"""
-        self.audio_manager.setup_sounds()
+        self.audio_manager.play_startup_sounds()
 
     def _apply_style_settings(self):
         """Apply the current style settings"""